@@ -52,4 +52,11 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Optional: uvloop speeds up scheduling of the concurrent LLM calls.
+    # uvloop.run() needs uvloop>=0.18 (pip install "uvloop>=0.18").
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
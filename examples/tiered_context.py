@@ -10,14 +10,21 @@ Run:  python examples/tiered_context.py
 from __future__ import annotations
 
 import asyncio
-import textwrap
 
-from swarmcore import Agent, Swarm, console_hooks, search_web
+from swarmcore import Agent, Swarm, cached_tool, console_hooks, search_web
 
 # ── Agents ────────────────────────────────────────────────────────
 
 MODEL = "openai/gpt-5.2"
 
+# Persist search results across reruns so repeated experiments skip the network.
+# Queries differing only in case or surrounding whitespace share an entry.
+cached_search = cached_tool(
+    ttl=86400,
+    store="~/.cache/swarmcore/search.sqlite",
+    key=lambda args: f"{args['query'].strip().lower()}\0{args['max_results']}",
+)(search_web)
+
 market_researcher = Agent(
     name="market_researcher",
     instructions=(
@@ -29,7 +36,7 @@ market_researcher = Agent(
         "Cite your sources with specific numbers."
     ),
     model=MODEL,
-    tools=[search_web],
+    tools=[cached_search],
 )
 
 tech_analyst = Agent(
@@ -127,7 +134,9 @@ async def main() -> None:
 
     result.print_summary()
 
-    print(textwrap.indent(result.output.strip(), "  "))
+    output = result.output.strip()
+    if output:
+        print("  " + output.replace("\n", "\n  "))
 
 
 if __name__ == "__main__":
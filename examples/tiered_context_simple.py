@@ -9,7 +9,6 @@ Run:  python examples/tiered_context_simple.py
 from __future__ import annotations
 
 import asyncio
-import textwrap
 
 from swarmcore import Swarm, analyst, console_hooks, editor, researcher, writer
 
@@ -30,7 +29,9 @@ TASK = (
 async def main() -> None:
     result = await swarm.run(TASK)
     result.print_summary()
-    print(textwrap.indent(result.output.strip(), "  "))
+    output = result.output.strip()
+    if output:
+        print("  " + output.replace("\n", "\n  "))
 
 
 if __name__ == "__main__":
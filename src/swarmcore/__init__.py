@@ -1,33 +1,103 @@
-"""SwarmCore - Coordinate AI agents in a workflow."""
+"""SwarmCore - Coordinate AI agents in a workflow.
+
+Public names are resolved lazily (PEP 562) so that importing the package
+does not pull in litellm until an agent-facing name is first used.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from swarmcore.agent import Agent, current_agent
+    from swarmcore.agents import analyst, editor, researcher, summarizer, writer
+    from swarmcore.console import ConsoleReporter, console_hooks
+    from swarmcore.context import SharedContext
+    from swarmcore.context_tools import make_context_tools
+    from swarmcore.exceptions import AgentError, SwarmError
+    from swarmcore.flow import Flow, chain, parallel
+    from swarmcore.hooks import (
+        AgentEndData,
+        AgentErrorData,
+        AgentRetryData,
+        AgentStartData,
+        Event,
+        EventType,
+        Hooks,
+        LLMCallEndData,
+        LLMCallStartData,
+        LLMTokenData,
+        StepEndData,
+        StepStartData,
+        SwarmEndData,
+        SwarmStartData,
+        ToolCallEndData,
+        ToolCallStartData,
+    )
+    from swarmcore.logging import LoggingHandler, enable_logging
+    from swarmcore.models import AgentResult, LLMCallRecord, SwarmResult, ToolCallRecord
+    from swarmcore.swarm import Swarm
+    from swarmcore.tools import cached_tool, search_web
+
+_LAZY: dict[str, str] = {
+    "Agent": "swarmcore.agent",
+    "current_agent": "swarmcore.agent",
+    "analyst": "swarmcore.agents",
+    "editor": "swarmcore.agents",
+    "researcher": "swarmcore.agents",
+    "summarizer": "swarmcore.agents",
+    "writer": "swarmcore.agents",
+    "ConsoleReporter": "swarmcore.console",
+    "console_hooks": "swarmcore.console",
+    "SharedContext": "swarmcore.context",
+    "make_context_tools": "swarmcore.context_tools",
+    "AgentError": "swarmcore.exceptions",
+    "SwarmError": "swarmcore.exceptions",
+    "Flow": "swarmcore.flow",
+    "chain": "swarmcore.flow",
+    "parallel": "swarmcore.flow",
+    "AgentEndData": "swarmcore.hooks",
+    "AgentErrorData": "swarmcore.hooks",
+    "AgentRetryData": "swarmcore.hooks",
+    "AgentStartData": "swarmcore.hooks",
+    "Event": "swarmcore.hooks",
+    "EventType": "swarmcore.hooks",
+    "Hooks": "swarmcore.hooks",
+    "LLMCallEndData": "swarmcore.hooks",
+    "LLMCallStartData": "swarmcore.hooks",
+    "LLMTokenData": "swarmcore.hooks",
+    "StepEndData": "swarmcore.hooks",
+    "StepStartData": "swarmcore.hooks",
+    "SwarmEndData": "swarmcore.hooks",
+    "SwarmStartData": "swarmcore.hooks",
+    "ToolCallEndData": "swarmcore.hooks",
+    "ToolCallStartData": "swarmcore.hooks",
+    "LoggingHandler": "swarmcore.logging",
+    "enable_logging": "swarmcore.logging",
+    "AgentResult": "swarmcore.models",
+    "LLMCallRecord": "swarmcore.models",
+    "SwarmResult": "swarmcore.models",
+    "ToolCallRecord": "swarmcore.models",
+    "Swarm": "swarmcore.swarm",
+    "cached_tool": "swarmcore.tools",
+    "search_web": "swarmcore.tools",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    # Cache on the package so later lookups skip this hook entirely
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
 
-from swarmcore.agent import Agent
-from swarmcore.agents import analyst, editor, researcher, summarizer, writer
-from swarmcore.console import ConsoleReporter, console_hooks
-from swarmcore.context import SharedContext
-from swarmcore.context_tools import make_context_tools
-from swarmcore.exceptions import AgentError, SwarmError
-from swarmcore.flow import Flow, chain, parallel
-from swarmcore.hooks import (
-    AgentEndData,
-    AgentErrorData,
-    AgentRetryData,
-    AgentStartData,
-    Event,
-    EventType,
-    Hooks,
-    LLMCallEndData,
-    LLMCallStartData,
-    StepEndData,
-    StepStartData,
-    SwarmEndData,
-    SwarmStartData,
-    ToolCallEndData,
-    ToolCallStartData,
-)
-from swarmcore.logging import LoggingHandler, enable_logging
-from swarmcore.models import AgentResult, LLMCallRecord, SwarmResult, ToolCallRecord
-from swarmcore.swarm import Swarm
-from swarmcore.tools import search_web
 
 __all__ = [
     "Agent",
@@ -46,6 +116,7 @@ __all__ = [
     "LLMCallEndData",
     "LLMCallStartData",
     "LLMCallRecord",
+    "LLMTokenData",
     "LoggingHandler",
     "SharedContext",
     "StepEndData",
@@ -58,8 +129,10 @@ __all__ = [
     "ToolCallEndData",
     "ToolCallRecord",
     "ToolCallStartData",
+    "cached_tool",
     "chain",
     "console_hooks",
+    "current_agent",
     "editor",
     "enable_logging",
     "make_context_tools",
@@ -1,14 +1,45 @@
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
 import inspect
 import json
+import re
 import time
-from typing import TYPE_CHECKING, Any, Callable, cast, get_type_hints
+import types
+import weakref
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Coroutine
+from contextvars import ContextVar
+from enum import Enum
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Concatenate,
+    ParamSpec,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
 
 import litellm
-from litellm.types.utils import Choices, ModelResponse, Usage
+from litellm.types.utils import (
+    ChatCompletionMessageToolCall,
+    Choices,
+    Function,
+    ModelResponse,
+)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 from swarmcore.context import SharedContext
+from swarmcore.context_tools import _runs_inline
 from swarmcore.exceptions import AgentError
 from swarmcore.hooks import (
     AgentEndData,
@@ -19,6 +50,7 @@ from swarmcore.hooks import (
     Hooks,
     LLMCallEndData,
     LLMCallStartData,
+    LLMTokenData,
     ToolCallEndData,
     ToolCallStartData,
 )
@@ -27,6 +59,42 @@ from swarmcore.models import AgentResult, LLMCallRecord, TokenUsage, ToolCallRec
 if TYPE_CHECKING:
     from swarmcore.flow import Flow
 
+_P = ParamSpec("_P")
+
+
+def _loads(data: str) -> Any:
+    """Decode JSON, using ``orjson`` when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _tool_result_to_str(result: Any) -> str:
+    """Render a tool's return value as message content.
+
+    Dicts and lists are sent as JSON rather than their Python ``repr``;
+    anything that cannot be serialized falls back to ``str``.
+    """
+    if isinstance(result, (dict, list)):
+        try:
+            if orjson is not None:
+                return orjson.dumps(
+                    result, default=str, option=orjson.OPT_NON_STR_KEYS
+                ).decode()
+            return json.dumps(result, ensure_ascii=False, default=str)
+        except (TypeError, ValueError):
+            pass
+    return str(result)
+
+
+current_agent: ContextVar[str | None] = ContextVar("current_agent", default=None)
+"""Name of the agent whose ``run()`` is executing in the current task.
+
+Set for the whole run, including hook emission and tool calls, so hook
+handlers, tools, and LiteLLM callbacks can attribute work to an agent.
+Parallel branches run in separate tasks and each see their own agent.
+"""
+
 _PYTHON_TO_JSON_SCHEMA: dict[type, str] = {
     str: "string",
     int: "integer",
@@ -36,14 +104,57 @@ _PYTHON_TO_JSON_SCHEMA: dict[type, str] = {
 }
 
 
+_PARAM_DOC_RE = re.compile(r"^[ \t]*(\w+)[ \t]*:(.*)$", re.MULTILINE)
+
+# Schemas are derived purely from the function object, so they are computed
+# once per function and shared.  Weak keys let tools defined per run (e.g.
+# closures over a context) be collected along with their schema.
+_schema_cache: weakref.WeakKeyDictionary[Callable[..., Any], dict[str, Any]] = (
+    weakref.WeakKeyDictionary()
+)
+# Bound methods are created afresh on every attribute access, so they are
+# keyed by their underlying function instead; ``self`` is never part of
+# the schema, so every instance shares one entry.
+_method_schema_cache: weakref.WeakKeyDictionary[Callable[..., Any], dict[str, Any]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
 def _function_to_tool_schema(func: Callable[..., Any]) -> dict[str, Any]:
-    """Convert a Python function to an OpenAI function-calling tool schema."""
+    """Convert a Python function to an OpenAI function-calling tool schema.
+
+    The result is cached per function and shared between agents; treat it
+    as read-only.
+    """
+    if inspect.ismethod(func):
+        cache, key = _method_schema_cache, func.__func__
+    else:
+        cache, key = _schema_cache, func
+    try:
+        return cache[key]
+    except (KeyError, TypeError):
+        pass
+
+    schema = _build_tool_schema(func)
+    try:
+        cache[key] = schema
+    except TypeError:
+        pass  # not weak-referenceable; rebuilt on each call
+    return schema
+
+
+def _build_tool_schema(func: Callable[..., Any]) -> dict[str, Any]:
     sig = inspect.signature(func)
     hints = get_type_hints(func)
     doc = inspect.getdoc(func) or ""
 
     description = doc.split("\n")[0].strip() if doc else func.__name__
 
+    # First "name: description" line per parameter name, in one scan
+    param_docs: dict[str, str] = {}
+    for match in _PARAM_DOC_RE.finditer(doc):
+        param_docs.setdefault(match.group(1), match.group(2).strip())
+
     properties: dict[str, Any] = {}
     required: list[str] = []
 
@@ -52,15 +163,8 @@ def _function_to_tool_schema(func: Callable[..., Any]) -> dict[str, Any]:
         json_type = _PYTHON_TO_JSON_SCHEMA.get(param_type, "string")
         properties[param_name] = {"type": json_type}
 
-        for line in doc.split("\n"):
-            stripped = line.strip()
-            if stripped.startswith(f"{param_name}:") or stripped.startswith(
-                f"{param_name} :"
-            ):
-                properties[param_name]["description"] = stripped.split(":", 1)[
-                    1
-                ].strip()
-                break
+        if param_name in param_docs:
+            properties[param_name]["description"] = param_docs[param_name]
 
         if param.default is inspect.Parameter.empty:
             required.append(param_name)
@@ -79,7 +183,141 @@ def _function_to_tool_schema(func: Callable[..., Any]) -> dict[str, Any]:
     }
 
 
+class _ToolKind(Enum):
+    """How a tool is invoked, decided once when it is registered."""
+
+    SYNC = "sync"  # plain function: run in a worker thread
+    COROUTINE = "coroutine"  # ``async def``: awaited directly
+    INLINE = "inline"  # cheap context reader: called directly on the loop
+    MAYBE_AWAITABLE = "maybe_awaitable"  # anything else: thread, then await if needed
+
+
+def _may_be_awaitable(hint: Any) -> bool:
+    """False only when the resolved return *hint* rules out an awaitable."""
+    if hint is Any or hint is object:
+        return True
+    if isinstance(hint, TypeVar):
+        bounds = hint.__constraints__ or (
+            (hint.__bound__,) if hint.__bound__ is not None else ()
+        )
+        return not bounds or any(_may_be_awaitable(b) for b in bounds)
+    origin = get_origin(hint)
+    if origin is Union or origin is types.UnionType:
+        return any(_may_be_awaitable(arg) for arg in get_args(hint))
+    target = origin if origin is not None else hint
+    if not isinstance(target, type):
+        return True  # Literal, ForwardRef and the like: not worth guessing
+    return issubclass(target, (Awaitable, Coroutine))
+
+
+def _tool_kind(func: Callable[..., Any]) -> _ToolKind:
+    if inspect.iscoroutinefunction(func) or inspect.iscoroutinefunction(
+        type(func).__call__
+    ):
+        return _ToolKind.COROUTINE
+    if _runs_inline(func):
+        return _ToolKind.INLINE
+    # Only trust a declared return type: an unannotated function may still
+    # hand back a coroutine.
+    if inspect.isfunction(func) or inspect.ismethod(func):
+        try:
+            hints = get_type_hints(func)
+        except (NameError, SyntaxError, TypeError):
+            return _ToolKind.MAYBE_AWAITABLE  # unresolvable annotation
+        if "return" in hints and not _may_be_awaitable(hints["return"]):
+            return _ToolKind.SYNC
+    return _ToolKind.MAYBE_AWAITABLE
+
+
+# Stand-in when a run has no hooks, so event guards need no ``None`` check
+_NO_HOOKS = Hooks()
+
+_EPHEMERAL = {"type": "ephemeral"}
+_TOOL_CALL_TYPE = "function"
+
+_BATCH_RESPONSE_RE = re.compile(r'<response id="(\d+)">(.*?)</response>', re.DOTALL)
+
+
+def _pack_batch(tasks: list[str]) -> str:
+    """Combine *tasks* into one numbered prompt for :meth:`Agent.run_batch`."""
+    sections = [f"### Task {i}\n{task}" for i, task in enumerate(tasks, 1)]
+    return (
+        "Complete each of the following tasks independently. Wrap your answer "
+        'to task N in <response id="N">...</response>, one block per task.\n\n'
+        + "\n\n".join(sections)
+    )
+
+
+class _HeldEvents:
+    """Hold events back until :meth:`release`, then pass them straight through.
+
+    Tool calls started while their turn is still streaming would otherwise
+    report ``TOOL_CALL_START`` before that turn's ``LLM_CALL_END``.
+    """
+
+    __slots__ = ("_events", "_hooks")
+
+    def __init__(self, hooks: Hooks) -> None:
+        self._hooks = hooks
+        self._events: list[Event] | None = []
+
+    def emit(self, event: Event) -> None:
+        if self._events is None:
+            self._hooks.emit_nowait(event)
+        else:
+            self._events.append(event)
+
+    def release(self) -> None:
+        events, self._events = self._events, None
+        for event in events or ():
+            self._hooks.emit_nowait(event)
+
+
+def _supports_cache_control(model: str) -> bool:
+    """Whether *model* accepts explicit Anthropic-style ``cache_control`` markers."""
+    try:
+        _, provider, _, _ = litellm.get_llm_provider(model)
+    except (litellm.exceptions.BadRequestError, ValueError):
+        return False  # provider not recognised
+    if provider == "anthropic":
+        return True
+    return provider in ("bedrock", "vertex_ai") and "claude" in model
+
+
+def _tracks_current_agent(
+    run: Callable[Concatenate[Agent, _P], Awaitable[AgentResult]],
+) -> Callable[Concatenate[Agent, _P], Awaitable[AgentResult]]:
+    """Set :data:`current_agent` to the agent's name for the duration of *run*."""
+
+    @functools.wraps(run)
+    async def wrapper(self: Agent, *args: _P.args, **kwargs: _P.kwargs) -> AgentResult:
+        token = current_agent.set(self.name)
+        try:
+            return await run(self, *args, **kwargs)
+        finally:
+            current_agent.reset(token)
+
+    return wrapper
+
+
 class Agent:
+    __slots__ = (
+        "_base_kwargs",
+        "_cache_control",
+        "_response_cache",
+        "_response_cache_size",
+        "_tool_kinds",
+        "_tool_schemas",
+        "_tools",
+        "instructions",
+        "max_retries",
+        "max_turns",
+        "model",
+        "name",
+        "stream",
+        "timeout",
+    )
+
     def __init__(
         self,
         name: str,
@@ -89,6 +327,8 @@ class Agent:
         timeout: float | None = None,
         max_retries: int | None = None,
         max_turns: int | None = None,
+        cache_size: int = 0,
+        stream: bool = False,
     ) -> None:
         self.name = name
         self.instructions = instructions
@@ -96,15 +336,32 @@ class Agent:
         self.timeout = timeout
         self.max_retries = max_retries
         self.max_turns = max_turns
+        self.stream = stream
 
         self._tools: dict[str, Callable[..., Any]] = {}
+        # How each tool is invoked, classified once here so dispatch doesn't
+        # re-inspect the tool or its result on every call
+        self._tool_kinds: dict[str, _ToolKind] = {}
         self._tool_schemas: list[dict[str, Any]] = []
 
         if tools:
             for func in tools:
                 self._tools[func.__name__] = func
+                self._tool_kinds[func.__name__] = _tool_kind(func)
                 self._tool_schemas.append(_function_to_tool_schema(func))
 
+        # LRU of final outputs keyed by (model, system prompt, task); off when 0
+        self._response_cache: OrderedDict[str, str] | None = (
+            OrderedDict() if cache_size > 0 else None
+        )
+        self._response_cache_size = cache_size
+
+        # Per-call kwargs that do not depend on the run; copied into each run
+        self._cache_control = _supports_cache_control(model)
+        self._base_kwargs: dict[str, Any] = {}
+        if self._tool_schemas:
+            self._base_kwargs["tools"] = self._prepare_tools(self._tool_schemas)
+
     def __rshift__(self, other: Agent | Flow) -> Flow:
         from swarmcore.flow import Flow as _Flow
 
@@ -116,7 +373,8 @@ class Agent:
         return NotImplemented
 
     def __or__(self, other: Agent | Flow) -> Flow:
-        from swarmcore.flow import Flow as _Flow, _or_items
+        from swarmcore.flow import Flow as _Flow
+        from swarmcore.flow import _or_items
 
         other_items = _or_items(other)
         if not other_items:
@@ -126,6 +384,231 @@ class Agent:
         items.extend(other_items)
         return _Flow([items])
 
+    def _prepare_tools(self, schemas: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Return *schemas* as sent to the provider.
+
+        For models that take explicit cache breakpoints, the last schema is
+        marked with ``cache_control`` so the tool definitions are cached
+        along with the prompt prefix.  The shared schema dicts are never
+        modified.
+        """
+        if not self._cache_control:
+            return schemas
+        return [*schemas[:-1], {**schemas[-1], "cache_control": _EPHEMERAL}]
+
+    async def _invoke_tool(
+        self,
+        tool_call: Any,
+        run_tools: dict[str, Callable[..., Any]],
+        tool_kinds: dict[str, _ToolKind],
+        arg_cache: dict[str, Any],
+        hooks: Hooks,
+        held: _HeldEvents | None = None,
+    ) -> tuple[ToolCallRecord, str]:
+        """Execute one requested tool call, returning its record and message content.
+
+        Sync tools run in a worker thread so a blocking tool does not stall
+        the event loop or its sibling calls.  Failures are reported back to
+        the model as ``"Error: ..."`` content rather than raised.  Tool
+        events go through *held* when given.
+        """
+        emit = held.emit if held is not None else hooks.emit_nowait
+        fn_name = tool_call.function.name or "unknown"
+
+        raw_args = tool_call.function.arguments
+        try:
+            fn_args = arg_cache.get(raw_args)
+            if fn_args is None:
+                fn_args = arg_cache[raw_args] = _loads(raw_args)
+        except (ValueError, TypeError) as e:
+            error_str = f"Error: invalid arguments JSON: {e}"
+            return ToolCallRecord(tool_name=fn_name, result=error_str), error_str
+
+        func = run_tools.get(fn_name)
+        if func is None:
+            error_str = f"Error: unknown tool '{fn_name}'"
+            return (
+                ToolCallRecord(tool_name=fn_name, arguments=fn_args, result=error_str),
+                error_str,
+            )
+
+        if hooks.is_subscribed(EventType.TOOL_CALL_START):
+            emit(
+                Event(
+                    EventType.TOOL_CALL_START,
+                    ToolCallStartData(agent=self.name, tool=fn_name, arguments=fn_args),
+                )
+            )
+
+        tool_start = time.perf_counter_ns()
+        try:
+            kind = tool_kinds[fn_name]
+            if kind is _ToolKind.COROUTINE:
+                result = await func(**fn_args)
+            elif kind is _ToolKind.INLINE:
+                result = func(**fn_args)
+            else:
+                result = await asyncio.to_thread(func, **fn_args)
+                if kind is _ToolKind.MAYBE_AWAITABLE and inspect.isawaitable(result):
+                    result = await result
+            result_str = _tool_result_to_str(result)
+        except Exception as e:
+            result_str = f"Error: tool '{fn_name}' failed: {e}"
+        tool_duration = (time.perf_counter_ns() - tool_start) / 1e9
+
+        if hooks.is_subscribed(EventType.TOOL_CALL_END):
+            emit(
+                Event(
+                    EventType.TOOL_CALL_END,
+                    ToolCallEndData(
+                        agent=self.name, tool=fn_name, duration_seconds=tool_duration
+                    ),
+                )
+            )
+
+        record = ToolCallRecord(
+            tool_name=fn_name,
+            arguments=fn_args,
+            result=result_str[:1000],
+            duration_seconds=tool_duration,
+        )
+        return record, result_str
+
+    async def _stream_completion(
+        self,
+        kwargs: dict[str, Any],
+        call_index: int,
+        hooks: Hooks,
+        run_tools: dict[str, Callable[..., Any]],
+        tool_kinds: dict[str, _ToolKind],
+        arg_cache: dict[str, Any],
+        early: dict[str, asyncio.Task[tuple[ToolCallRecord, str]]],
+        held: _HeldEvents,
+    ) -> ModelResponse:
+        """Request a streamed completion, emitting ``LLM_TOKEN`` per content delta.
+
+        Tool calls stream in index order, so once a delta for the next call
+        arrives the previous call's arguments are complete; that call is
+        started right away and its task stored in *early* by id, overlapping
+        tool execution with the rest of the generation.  Those calls' tool
+        events wait in *held* until the caller releases them after
+        ``LLM_CALL_END``.  The chunks are
+        reassembled into a regular :class:`ModelResponse` (content, tool
+        calls, and usage) once the stream ends.
+        """
+        stream = await litellm.acompletion(
+            **kwargs, stream=True, stream_options={"include_usage": True}
+        )
+        emit = hooks.is_subscribed(EventType.LLM_TOKEN)
+        chunks: list[Any] = []
+        # index -> [id, name, arguments] accumulated from tool-call deltas
+        partial: dict[int, list[str]] = {}
+        current: int | None = None
+        try:
+            async for chunk in stream:  # type: ignore[union-attr]
+                chunks.append(chunk)
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta
+                text = delta.content
+                if emit and text:
+                    hooks.emit_nowait(
+                        Event(
+                            EventType.LLM_TOKEN,
+                            LLMTokenData(
+                                agent=self.name, call_index=call_index, text=text
+                            ),
+                        )
+                    )
+                if not run_tools or not delta.tool_calls:
+                    continue
+                for tc_delta in delta.tool_calls:
+                    if current is not None and tc_delta.index != current:
+                        call_id, name, arguments = partial[current]
+                        if call_id and call_id not in early:
+                            tool_call = ChatCompletionMessageToolCall(
+                                id=call_id,
+                                type=_TOOL_CALL_TYPE,
+                                function=Function(name=name, arguments=arguments),
+                            )
+                            early[call_id] = asyncio.create_task(
+                                self._invoke_tool(
+                                    tool_call,
+                                    run_tools,
+                                    tool_kinds,
+                                    arg_cache,
+                                    hooks,
+                                    held,
+                                )
+                            )
+                    current = tc_delta.index
+                    acc = partial.setdefault(current, ["", "", ""])
+                    if tc_delta.id:
+                        acc[0] = tc_delta.id
+                    if tc_delta.function.name:
+                        acc[1] = tc_delta.function.name
+                    if tc_delta.function.arguments:
+                        acc[2] += tc_delta.function.arguments
+
+            response = litellm.stream_chunk_builder(chunks, messages=kwargs["messages"])
+            if not isinstance(response, ModelResponse):
+                raise AgentError(self.name, "LLM stream ended without a response")
+        except BaseException:
+            for pending in early.values():
+                pending.cancel()
+            raise
+        return response
+
+    async def _finish_run(
+        self,
+        task: str,
+        output: str,
+        start: int,
+        hooks: Hooks,
+        *,
+        token_usage: TokenUsage | None = None,
+        llm_calls: list[LLMCallRecord] | None = None,
+        tool_calls: list[ToolCallRecord] | None = None,
+        cost: float = 0.0,
+        cached: bool = False,
+    ) -> AgentResult:
+        """Build the run's :class:`AgentResult`, emit ``AGENT_END`` and drain hooks."""
+        llm_calls = llm_calls or []
+        tool_calls = tool_calls or []
+        # Every field is produced here, so skip Pydantic validation
+        agent_result = AgentResult.model_construct(
+            agent_name=self.name,
+            input_task=task,
+            output=output,
+            model=self.model,
+            duration_seconds=(time.perf_counter_ns() - start) / 1e9,
+            token_usage=token_usage or TokenUsage(),
+            llm_calls=llm_calls,
+            tool_calls=tool_calls,
+            llm_call_count=len(llm_calls),
+            tool_call_count=len(tool_calls),
+            cost=cost,
+            cached=cached,
+        )
+
+        if hooks.is_subscribed(EventType.AGENT_END):
+            hooks.emit_nowait(
+                Event(
+                    EventType.AGENT_END,
+                    AgentEndData(
+                        agent=self.name,
+                        duration_seconds=agent_result.duration_seconds,
+                        cost=cost,
+                    ),
+                )
+            )
+        # Async handlers were scheduled during the run; let them finish
+        # before the result is handed on
+        await hooks.drain()
+
+        return agent_result
+
+    @_tracks_current_agent
     async def run(
         self,
         task: str,
@@ -140,23 +623,38 @@ class Agent:
         swarm_max_retries: int | None = None,
     ) -> AgentResult:
         """Execute the agent on a task with shared context."""
-        start = time.monotonic()
+        start = time.perf_counter_ns()
+        if hooks is None:
+            hooks = _NO_HOOKS
         total_usage = TokenUsage()
         total_cost = 0.0
         llm_call_records: list[LLMCallRecord] = []
         tool_call_records: list[ToolCallRecord] = []
         call_index = 0
 
-        # Build run-local tool registry (agent tools + any extras)
-        run_tools: dict[str, Callable[..., Any]] = dict(self._tools)
-        run_schemas: list[dict[str, Any]] = list(self._tool_schemas)
+        # Run-local tool registry: the agent's own tools, copied only when
+        # extras are added so they don't leak into later runs
+        run_tools = self._tools
+        tool_kinds = self._tool_kinds
+        # Decoded tool arguments by raw JSON string; models often repeat a
+        # call verbatim across turns.  Tools receive them unpacked as kwargs,
+        # so the cached dicts are never mutated.
+        arg_cache: dict[str, Any] = {}
+        # Tool calls already started while their turn was still streaming
+        early: dict[str, asyncio.Task[tuple[ToolCallRecord, str]]] = {}
+        kwargs: dict[str, Any] = dict(self._base_kwargs)
         if extra_tools:
+            run_tools = dict(self._tools)
+            tool_kinds = dict(self._tool_kinds)
+            run_schemas = list(self._tool_schemas)
             for func in extra_tools:
                 run_tools[func.__name__] = func
+                tool_kinds[func.__name__] = _tool_kind(func)
                 run_schemas.append(_function_to_tool_schema(func))
+            kwargs["tools"] = self._prepare_tools(run_schemas)
 
-        if hooks and hooks.is_active:
-            await hooks.emit(
+        if hooks.is_subscribed(EventType.AGENT_START):
+            hooks.emit_nowait(
                 Event(EventType.AGENT_START, AgentStartData(agent=self.name, task=task))
             )
 
@@ -166,16 +664,14 @@ class Agent:
             self.max_retries if self.max_retries is not None else swarm_max_retries
         )
 
+        # Static sections first, per-run context last: providers cache the
+        # longest unchanged prompt prefix, so keeping the instructions and
+        # format rules ahead of the context lets repeat runs of this agent
+        # reuse them.
         system_content = self.instructions
-        if context_hint is not None:
-            system_content += "\n\n# Available context\n" + context_hint
-        else:
-            context_str = context.format_for_prompt(expand=expand)
-            if context_str:
-                system_content += "\n\n# Context from prior agents\n" + context_str
         if "expand_context" in run_tools:
             system_content += (
-                "\n\nSome prior agents' outputs above are shown as summaries. "
+                "\n\nSome prior agents' outputs below are shown as summaries. "
                 "If you need the full detailed output from any of them, "
                 "call the `expand_context` tool with that agent's name."
             )
@@ -192,23 +688,48 @@ class Agent:
                 "\n"
                 "Your full detailed response here."
             )
+        if context_hint is not None:
+            system_content += "\n\n# Available context\n" + context_hint
+        else:
+            context_str = context.format_for_prompt(expand=expand)
+            if context_str:
+                system_content += "\n\n# Context from prior agents\n" + context_str
 
+        system_message: dict[str, Any] = {"role": "system", "content": system_content}
+        if self._cache_control:
+            # Breakpoint at the end of the system prompt, so the tool schemas
+            # and system prompt are read from the provider cache by retries
+            # and repeat runs over the same context
+            system_message["cache_control"] = _EPHEMERAL
         messages: list[dict[str, Any]] = [
-            {"role": "system", "content": system_content},
+            system_message,
             {"role": "user", "content": task},
         ]
 
-        kwargs: dict[str, Any] = {
-            "model": self.model,
-            "messages": messages,
-        }
-        if run_schemas:
-            kwargs["tools"] = run_schemas
+        kwargs["model"] = self.model
+        kwargs["messages"] = messages
+        # Forwarded by LiteLLM to success/failure callbacks, so they can
+        # attribute each completion without wrapping acompletion.
+        kwargs["metadata"] = {"agent_name": self.name}
         if effective_timeout is not None:
             kwargs["timeout"] = effective_timeout
         if effective_max_retries is not None:
             kwargs["max_retries"] = effective_max_retries
 
+        # Opt-in response cache: only runs without tools are cacheable, since
+        # a tool-using run's output depends on what the tools return.
+        cache_key: str | None = None
+        if self._response_cache is not None and not run_tools:
+            cache_key = hashlib.blake2b(
+                f"{self.model}\0{system_content}\0{task}".encode(), digest_size=16
+            ).hexdigest()
+            cached_output = self._response_cache.get(cache_key)
+            if cached_output is not None:
+                self._response_cache.move_to_end(cache_key)
+                return await self._finish_run(
+                    task, cached_output, start, hooks, cached=True
+                )
+
         try:
             while True:
                 if self.max_turns is not None and call_index >= self.max_turns:
@@ -218,17 +739,32 @@ class Agent:
                         "with no final response",
                     )
 
-                if hooks and hooks.is_active:
-                    await hooks.emit(
+                if hooks.is_subscribed(EventType.LLM_CALL_START):
+                    hooks.emit_nowait(
                         Event(
                             EventType.LLM_CALL_START,
                             LLMCallStartData(agent=self.name, call_index=call_index),
                         )
                     )
 
-                llm_start = time.monotonic()
-                response = cast(ModelResponse, await litellm.acompletion(**kwargs))
-                llm_duration = round(time.monotonic() - llm_start, 3)
+                llm_start = time.perf_counter_ns()
+                response: ModelResponse
+                held: _HeldEvents | None = None
+                if self.stream:
+                    held = _HeldEvents(hooks)
+                    response = await self._stream_completion(
+                        kwargs,
+                        call_index,
+                        hooks,
+                        run_tools,
+                        tool_kinds,
+                        arg_cache,
+                        early,
+                        held,
+                    )
+                else:
+                    response = await litellm.acompletion(**kwargs)  # type: ignore[assignment]
+                llm_duration = (time.perf_counter_ns() - llm_start) / 1e9
 
                 # Cost estimation (graceful degradation)
                 call_cost = 0.0
@@ -237,21 +773,14 @@ class Agent:
                 except Exception:
                     pass
 
-                usage = cast(Usage | None, getattr(response, "usage", None))
-                call_usage = TokenUsage()
-                if usage:
-                    call_usage.prompt_tokens = usage.prompt_tokens or 0
-                    call_usage.completion_tokens = usage.completion_tokens or 0
-                    call_usage.total_tokens = usage.total_tokens or 0
-                    total_usage.prompt_tokens += call_usage.prompt_tokens
-                    total_usage.completion_tokens += call_usage.completion_tokens
-                    total_usage.total_tokens += call_usage.total_tokens
+                call_usage = TokenUsage.from_usage(getattr(response, "usage", None))
+                total_usage += call_usage
 
                 total_cost += call_cost
 
-                choice = cast(Choices, response.choices[0])
+                choice: Choices = response.choices[0]  # type: ignore[assignment]
                 message = choice.message
-                finish_reason = getattr(choice, "finish_reason", None) or ""
+                finish_reason = choice.finish_reason or ""
 
                 tool_names_requested: list[str] = []
                 if message.tool_calls:
@@ -259,7 +788,7 @@ class Agent:
                         str(tc.function.name) for tc in message.tool_calls
                     ]
 
-                llm_record = LLMCallRecord(
+                llm_record = LLMCallRecord.model_construct(
                     call_index=call_index,
                     token_usage=call_usage,
                     duration_seconds=llm_duration,
@@ -269,8 +798,8 @@ class Agent:
                 )
                 llm_call_records.append(llm_record)
 
-                if hooks and hooks.is_active:
-                    await hooks.emit(
+                if hooks.is_subscribed(EventType.LLM_CALL_END):
+                    hooks.emit_nowait(
                         Event(
                             EventType.LLM_CALL_END,
                             LLMCallEndData(
@@ -284,6 +813,8 @@ class Agent:
                             ),
                         )
                     )
+                if held is not None:
+                    held.release()
 
                 call_index += 1
 
@@ -292,163 +823,191 @@ class Agent:
                     break
 
                 # Manually construct assistant message dict for compatibility
-                msg_dict: dict[str, Any] = {
-                    "role": "assistant",
-                    "content": message.content,
-                }
-                msg_dict["tool_calls"] = [
+                messages.append(
                     {
-                        "id": tc.id,
-                        "type": "function",
-                        "function": {
-                            "name": tc.function.name,
-                            "arguments": tc.function.arguments,
-                        },
-                    }
-                    for tc in message.tool_calls
-                ]
-                messages.append(msg_dict)
-
-                for tool_call in message.tool_calls:
-                    fn_name = tool_call.function.name or "unknown"
-
-                    try:
-                        fn_args = json.loads(tool_call.function.arguments)
-                    except (json.JSONDecodeError, TypeError) as e:
-                        error_str = f"Error: invalid arguments JSON: {e}"
-                        tool_call_records.append(
-                            ToolCallRecord(
-                                tool_name=fn_name,
-                                arguments={},
-                                result=error_str,
-                                duration_seconds=0.0,
-                            )
-                        )
-                        messages.append(
+                        "role": "assistant",
+                        "content": message.content,
+                        "tool_calls": [
                             {
-                                "role": "tool",
-                                "tool_call_id": tool_call.id,
-                                "content": error_str,
+                                "id": tc.id,
+                                "type": _TOOL_CALL_TYPE,
+                                "function": {
+                                    "name": tc.function.name,
+                                    "arguments": tc.function.arguments,
+                                },
                             }
-                        )
-                        continue
-
-                    if fn_name not in run_tools:
-                        error_str = f"Error: unknown tool '{fn_name}'"
-                        tool_call_records.append(
-                            ToolCallRecord(
-                                tool_name=fn_name,
-                                arguments=fn_args,
-                                result=error_str,
-                                duration_seconds=0.0,
+                            for tc in message.tool_calls
+                        ],
+                    }
+                )
+
+                # Run every tool call from this turn concurrently; results
+                # are appended in the order the model requested them.  A lone
+                # call (the common case) is awaited directly, skipping gather.
+                if len(message.tool_calls) == 1:
+                    tool_call = message.tool_calls[0]
+                    outcomes = [
+                        await (
+                            early.pop(tool_call.id, None)
+                            or self._invoke_tool(
+                                tool_call, run_tools, tool_kinds, arg_cache, hooks
                             )
                         )
-                        messages.append(
-                            {
-                                "role": "tool",
-                                "tool_call_id": tool_call.id,
-                                "content": error_str,
-                            }
-                        )
-                        continue
-
-                    if hooks and hooks.is_active:
-                        await hooks.emit(
-                            Event(
-                                EventType.TOOL_CALL_START,
-                                ToolCallStartData(
-                                    agent=self.name,
-                                    tool=fn_name,
-                                    arguments=fn_args,
-                                ),
+                    ]
+                else:
+                    outcomes = await asyncio.gather(
+                        *(
+                            early.pop(tool_call.id, None)
+                            or self._invoke_tool(
+                                tool_call, run_tools, tool_kinds, arg_cache, hooks
                             )
+                            for tool_call in message.tool_calls
                         )
-
-                    tool_start = time.monotonic()
-                    try:
-                        result = run_tools[fn_name](**fn_args)
-                        if inspect.isawaitable(result):
-                            result = await result
-                        result_str = str(result)
-                    except Exception as e:
-                        result_str = f"Error: tool '{fn_name}' failed: {e}"
-                    tool_duration = round(time.monotonic() - tool_start, 3)
-
-                    tool_record = ToolCallRecord(
-                        tool_name=fn_name,
-                        arguments=fn_args,
-                        result=result_str[:1000],
-                        duration_seconds=tool_duration,
                     )
+                for pending in early.values():
+                    pending.cancel()
+                early.clear()
+                for tool_call, (tool_record, content) in zip(
+                    message.tool_calls, outcomes
+                ):
                     tool_call_records.append(tool_record)
-
-                    if hooks and hooks.is_active:
-                        await hooks.emit(
-                            Event(
-                                EventType.TOOL_CALL_END,
-                                ToolCallEndData(
-                                    agent=self.name,
-                                    tool=fn_name,
-                                    duration_seconds=tool_duration,
-                                ),
-                            )
-                        )
-
                     messages.append(
                         {
                             "role": "tool",
                             "tool_call_id": tool_call.id,
-                            "content": result_str,
+                            "content": content,
                         }
                     )
 
-                kwargs["messages"] = messages
-
         except AgentError as ae:
-            if hooks and hooks.is_active:
-                await hooks.emit(
+            if hooks.is_subscribed(EventType.AGENT_ERROR):
+                hooks.emit_nowait(
                     Event(
                         EventType.AGENT_ERROR,
                         AgentErrorData(agent=self.name, error=str(ae)),
                     )
                 )
+            await hooks.drain()
             raise
         except Exception as e:
-            if hooks and hooks.is_active:
-                await hooks.emit(
+            if hooks.is_subscribed(EventType.AGENT_ERROR):
+                hooks.emit_nowait(
                     Event(
                         EventType.AGENT_ERROR,
                         AgentErrorData(agent=self.name, error=str(e)),
                     )
                 )
+            await hooks.drain()
             raise AgentError(self.name, str(e)) from e
 
-        duration = time.monotonic() - start
-
-        agent_result = AgentResult(
-            agent_name=self.name,
-            input_task=task,
-            output=output,
-            model=self.model,
-            duration_seconds=round(duration, 3),
+        if cache_key is not None:
+            assert self._response_cache is not None
+            self._response_cache[cache_key] = output
+            if len(self._response_cache) > self._response_cache_size:
+                self._response_cache.popitem(last=False)
+
+        return await self._finish_run(
+            task,
+            output,
+            start,
+            hooks,
             token_usage=total_usage,
             llm_calls=llm_call_records,
             tool_calls=tool_call_records,
-            llm_call_count=len(llm_call_records),
-            tool_call_count=len(tool_call_records),
             cost=total_cost,
         )
 
-        if hooks and hooks.is_active:
-            await hooks.emit(
-                Event(
-                    EventType.AGENT_END,
-                    AgentEndData(
-                        agent=self.name,
-                        duration_seconds=agent_result.duration_seconds,
-                        cost=total_cost,
-                    ),
+    async def run_batch(
+        self,
+        tasks: list[str],
+        context: SharedContext,
+        *,
+        batch_size: int = 10,
+        hooks: Hooks | None = None,
+        expand: set[str] | None = None,
+        swarm_timeout: float | None = None,
+        swarm_max_retries: int | None = None,
+    ) -> list[AgentResult]:
+        """Run many independent *tasks*, packing up to *batch_size* per request.
+
+        Each batch becomes a single :meth:`run` whose prompt numbers the
+        tasks and asks for one ``<response id="N">`` block per task, so the
+        system prompt and request overhead are paid once per batch rather
+        than once per task.  Batches run concurrently.  Returns one
+        :class:`AgentResult` per task, in order; the batch's LLM calls, tool
+        calls, token usage and cost are reported on the first result of each
+        batch so totals still sum correctly.  A task whose answer is missing
+        from the batch output is re-run on its own; if no answer parses at
+        all, the batch request is added to the first re-run's totals.
+
+        Latency grows with batch size, so *batch_size* is worth tuning per
+        model and task shape.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        run_kwargs: dict[str, Any] = {
+            "hooks": hooks,
+            "expand": expand,
+            "swarm_timeout": swarm_timeout,
+            "swarm_max_retries": swarm_max_retries,
+        }
+
+        async def run_one(batch: list[str]) -> list[AgentResult]:
+            if len(batch) == 1:
+                return [await self.run(batch[0], context, **run_kwargs)]
+            batch_result = await self.run(_pack_batch(batch), context, **run_kwargs)
+            answers = {
+                int(n): text.strip()
+                for n, text in _BATCH_RESPONSE_RE.findall(batch_result.output)
+            }
+            missing = [task for i, task in enumerate(batch, 1) if i not in answers]
+            reruns = iter(
+                await asyncio.gather(
+                    *(self.run(task, context, **run_kwargs) for task in missing)
                 )
             )
+            results: list[AgentResult] = []
+            reported = False
+            for i, task in enumerate(batch, 1):
+                answer = answers.get(i)
+                if answer is None:
+                    results.append(next(reruns))
+                elif not reported:
+                    reported = True
+                    results.append(
+                        batch_result.model_copy(
+                            update={"input_task": task, "output": answer}
+                        )
+                    )
+                else:
+                    results.append(
+                        AgentResult.model_construct(
+                            agent_name=self.name,
+                            input_task=task,
+                            output=answer,
+                            model=self.model,
+                            duration_seconds=batch_result.duration_seconds,
+                        )
+                    )
+            if not reported:
+                # No answer parsed: fold the batch request into the first re-run
+                first = results[0]
+                usage = first.token_usage.model_copy()
+                usage += batch_result.token_usage
+                results[0] = first.model_copy(
+                    update={
+                        "token_usage": usage,
+                        "llm_calls": [*batch_result.llm_calls, *first.llm_calls],
+                        "tool_calls": [*batch_result.tool_calls, *first.tool_calls],
+                        "llm_call_count": batch_result.llm_call_count
+                        + first.llm_call_count,
+                        "tool_call_count": batch_result.tool_call_count
+                        + first.tool_call_count,
+                        "cost": batch_result.cost + first.cost,
+                    }
+                )
+            return results
 
-        return agent_result
+        batches = [tasks[i : i + batch_size] for i in range(0, len(tasks), batch_size)]
+        grouped = await asyncio.gather(*(run_one(batch) for batch in batches))
+        return [result for group in grouped for result in group]
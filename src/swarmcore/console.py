@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import os
 import sys
-from typing import TextIO
+from collections.abc import Callable, Mapping
+from typing import Any, ClassVar, TextIO
 
-from swarmcore.hooks import Event, EventType, Hooks
+from swarmcore.hooks import Event, EventData, EventType, Hooks
+
+_Data = EventData | Mapping[str, Any]
 
 # ANSI escape sequences
 _GREEN = "\033[92m"
@@ -13,6 +17,30 @@ _DIM = "\033[2m"
 _BOLD = "\033[1m"
 _RESET = "\033[0m"
 
+# Horizontal rule framing each step header
+_RULE = "\u2500" * 70
+
+
+def _styler(code: str) -> Callable[[str], str]:
+    """Return a function wrapping text in the ANSI *code* and a reset."""
+
+    def style(text: str) -> str:
+        return code + text + _RESET
+
+    return style
+
+
+def _plain(text: str) -> str:
+    return text
+
+
+def _use_color(file: TextIO) -> bool:
+    """Whether to emit ANSI colors to *file* (a TTY, and ``NO_COLOR`` unset)."""
+    if "NO_COLOR" in os.environ:
+        return False
+    isatty = getattr(file, "isatty", None)
+    return bool(isatty and isatty())
+
 
 class ConsoleReporter:
     """Hook handler that prints formatted, colored execution progress to the terminal.
@@ -23,7 +51,9 @@ class ConsoleReporter:
     Parameters
     ----------
     color:
-        Enable ANSI color output. Set to ``False`` for plain text.
+        Enable ANSI color output. Set to ``False`` for plain text. Defaults
+        to ``None``, which enables color only when *file* is a terminal and
+        the ``NO_COLOR`` environment variable is unset.
     verbose:
         When ``True``, shows tool call arguments and result previews.
         When ``False``, shows just tool name and duration.
@@ -35,152 +65,163 @@ class ConsoleReporter:
     def __init__(
         self,
         *,
-        color: bool = True,
+        color: bool | None = None,
         verbose: bool = False,
         file: TextIO | None = None,
     ) -> None:
-        self._color = color
         self._verbose = verbose
         self._file = file or sys.stderr
-
-    # -- Color helpers ------------------------------------------------
-
-    def _c(self, code: str, text: str) -> str:
-        if not self._color:
-            return text
-        return f"{code}{text}{_RESET}"
-
-    def _bold(self, text: str) -> str:
-        return self._c(_BOLD, text)
-
-    def _dim(self, text: str) -> str:
-        return self._c(_DIM, text)
-
-    def _green(self, text: str) -> str:
-        return self._c(_GREEN, text)
-
-    def _yellow(self, text: str) -> str:
-        return self._c(_YELLOW, text)
-
-    def _red(self, text: str) -> str:
-        return self._c(_RED, text)
+        self._color = _use_color(self._file) if color is None else color
+
+        # Color helpers, fixed for the reporter's lifetime
+        self._bold: Callable[[str], str] = _plain
+        self._dim: Callable[[str], str] = _plain
+        self._green: Callable[[str], str] = _plain
+        self._yellow: Callable[[str], str] = _plain
+        self._red: Callable[[str], str] = _plain
+        if self._color:
+            self._bold = _styler(_BOLD)
+            self._dim = _styler(_DIM)
+            self._green = _styler(_GREEN)
+            self._yellow = _styler(_YELLOW)
+            self._red = _styler(_RED)
+        self._rule = self._bold(_RULE)
 
     # -- Output helpers -----------------------------------------------
 
     def _print(self, text: str = "", *, end: str = "\n", flush: bool = False) -> None:
-        print(text, end=end, flush=flush, file=self._file)
+        # One write per call (``print`` issues separate writes for text and end)
+        self._file.write(text + end)
+        if flush:
+            self._file.flush()
 
     def _section(self, title: str) -> None:
-        rule = "\u2500" * 70
-        self._print(f"\n{self._bold(rule)}")
-        self._print(f"  {self._bold(title)}")
-        self._print(self._bold(rule))
+        self._print(f"\n{self._rule}\n  {self._bold(title)}\n{self._rule}")
+
+    # -- Event handlers -----------------------------------------------
+
+    def _on_swarm_end(self, d: _Data) -> None:
+        dur = d.get("duration_seconds", "?")
+        count = d.get("agent_count", "?")
+        total_cost = d.get("total_cost", 0.0)
+        cost_part = ""
+        if total_cost:
+            cost_part = ", $" + f"{total_cost:.4f}"
+        self._print(
+            "\n  "
+            + self._bold("Done")
+            + " \u2014 "
+            + str(count)
+            + " agents, "
+            + str(dur)
+            + "s total"
+            + cost_part
+        )
+
+    def _on_step_start(self, d: _Data) -> None:
+        agents = d.get("agents", [])
+        par = d.get("parallel", False)
+        label = " | ".join(agents) if par else (agents[0] if agents else "?")
+        suffix = " (parallel)" if par else ""
+        self._section(f"Step {d.get('step_index', 0) + 1}: {label}{suffix}")
+
+    def _on_agent_start(self, d: _Data) -> None:
+        agent = d.get("agent", "?")
+        self._print(f"\n  {self._bold('▶ ' + agent)}")
+
+    def _on_llm_call_start(self, d: _Data) -> None:
+        idx = d.get("call_index", "?")
+        self._print(
+            f"  {self._dim('LLM call ' + str(idx) + '...')}",
+            end="",
+            flush=True,
+        )
+
+    def _on_llm_call_end(self, d: _Data) -> None:
+        dur = d.get("duration_seconds", "?")
+        tok = d.get("total_tokens", "?")
+        suffix = ""
+        if d.get("finish_reason") == "tool_calls":
+            suffix = " → " + self._yellow("tool_calls")
+        self._print(f" {dur}s, {tok} tok{suffix}")
+
+    def _on_tool_call_start(self, d: _Data) -> None:
+        tool = d.get("tool", "?")
+        if self._verbose:
+            args = ", ".join(f'{k}="{v}"' for k, v in d.get("arguments", {}).items())
+            self._print("  │ " + self._red("⚡ " + tool + "(" + args + ")"))
+        else:
+            self._print("  │ " + self._red("⚡ " + tool))
+
+    def _on_tool_call_end(self, d: _Data) -> None:
+        dur = d.get("duration_seconds", "?")
+        self._print("  │   " + self._dim("→ returned (" + str(dur) + "s)"))
+
+    def _on_agent_end(self, d: _Data) -> None:
+        name = d.get("agent", "?")
+        dur = d.get("duration_seconds", "?")
+        cost = d.get("cost", 0.0)
+        cost_suffix = ""
+        if cost:
+            cost_suffix = " $" + f"{cost:.4f}"
+        self._print(
+            "  " + self._green("✓ " + name + " done (" + str(dur) + "s)" + cost_suffix)
+        )
+
+    def _on_agent_retry(self, d: _Data) -> None:
+        name = d.get("agent", "?")
+        attempt = d.get("attempt", "?")
+        max_r = d.get("max_retries", "?")
+        err = d.get("error", "unknown")
+        delay = d.get("delay", "?")
+        self._print(
+            "  "
+            + self._yellow(
+                "⟳ "
+                + name
+                + " retry "
+                + str(attempt)
+                + "/"
+                + str(max_r)
+                + " ("
+                + str(err)
+                + ") — waiting "
+                + str(delay)
+                + "s"
+            )
+        )
+
+    def _on_agent_error(self, d: _Data) -> None:
+        name = d.get("agent", "?")
+        err = d.get("error", "unknown")
+        self._print("  " + self._red("✗ " + name + " error: " + str(err)))
+
+    # SWARM_START and STEP_END have no handler: section headers come from
+    # STEP_START, and a step's end is implied by the next header.
+    _DISPATCH: ClassVar[dict[EventType, Callable[[ConsoleReporter, _Data], None]]] = {
+        EventType.SWARM_END: _on_swarm_end,
+        EventType.STEP_START: _on_step_start,
+        EventType.AGENT_START: _on_agent_start,
+        EventType.LLM_CALL_START: _on_llm_call_start,
+        EventType.LLM_CALL_END: _on_llm_call_end,
+        EventType.TOOL_CALL_START: _on_tool_call_start,
+        EventType.TOOL_CALL_END: _on_tool_call_end,
+        EventType.AGENT_END: _on_agent_end,
+        EventType.AGENT_RETRY: _on_agent_retry,
+        EventType.AGENT_ERROR: _on_agent_error,
+    }
 
     # -- Event dispatch -----------------------------------------------
 
     def __call__(self, event: Event) -> None:
-        d = event.data
-        match event.type:
-            case EventType.SWARM_START:
-                pass  # section headers come from STEP_START
-            case EventType.SWARM_END:
-                dur = d.get("duration_seconds", "?")
-                count = d.get("agent_count", "?")
-                total_cost = d.get("total_cost", 0.0)
-                cost_part = ""
-                if total_cost:
-                    cost_part = ", $" + f"{total_cost:.4f}"
-                self._print(
-                    "\n  "
-                    + self._bold("Done")
-                    + " \u2014 "
-                    + str(count)
-                    + " agents, "
-                    + str(dur)
-                    + "s total"
-                    + cost_part
-                )
-            case EventType.STEP_START:
-                agents = d.get("agents", [])
-                par = d.get("parallel", False)
-                label = " | ".join(agents) if par else (agents[0] if agents else "?")
-                suffix = " (parallel)" if par else ""
-                self._section(f"Step {d.get('step_index', 0) + 1}: {label}{suffix}")
-            case EventType.STEP_END:
-                pass
-            case EventType.AGENT_START:
-                agent = d.get("agent", "?")
-                self._print(f"\n  {self._bold('▶ ' + agent)}")
-            case EventType.LLM_CALL_START:
-                idx = d.get("call_index", "?")
-                self._print(
-                    f"  {self._dim('LLM call ' + str(idx) + '...')}",
-                    end="",
-                    flush=True,
-                )
-            case EventType.LLM_CALL_END:
-                dur = d.get("duration_seconds", "?")
-                tok = d.get("total_tokens", "?")
-                suffix = ""
-                if d.get("finish_reason") == "tool_calls":
-                    suffix = " → " + self._yellow("tool_calls")
-                self._print(f" {dur}s, {tok} tok{suffix}")
-            case EventType.TOOL_CALL_START:
-                tool = d.get("tool", "?")
-                if self._verbose:
-                    args = ", ".join(
-                        f'{k}="{v}"' for k, v in d.get("arguments", {}).items()
-                    )
-                    self._print("  │ " + self._red("⚡ " + tool + "(" + args + ")"))
-                else:
-                    self._print("  │ " + self._red("⚡ " + tool))
-            case EventType.TOOL_CALL_END:
-                dur = d.get("duration_seconds", "?")
-                self._print("  │   " + self._dim("→ returned (" + str(dur) + "s)"))
-            case EventType.AGENT_END:
-                name = d.get("agent", "?")
-                dur = d.get("duration_seconds", "?")
-                cost = d.get("cost", 0.0)
-                cost_suffix = ""
-                if cost:
-                    cost_suffix = " $" + f"{cost:.4f}"
-                self._print(
-                    "  "
-                    + self._green(
-                        "✓ " + name + " done (" + str(dur) + "s)" + cost_suffix
-                    )
-                )
-            case EventType.AGENT_RETRY:
-                name = d.get("agent", "?")
-                attempt = d.get("attempt", "?")
-                max_r = d.get("max_retries", "?")
-                err = d.get("error", "unknown")
-                delay = d.get("delay", "?")
-                self._print(
-                    "  "
-                    + self._yellow(
-                        "⟳ "
-                        + name
-                        + " retry "
-                        + str(attempt)
-                        + "/"
-                        + str(max_r)
-                        + " ("
-                        + str(err)
-                        + ") — waiting "
-                        + str(delay)
-                        + "s"
-                    )
-                )
-            case EventType.AGENT_ERROR:
-                name = d.get("agent", "?")
-                err = d.get("error", "unknown")
-                self._print("  " + self._red("✗ " + name + " error: " + str(err)))
+        handler = self._DISPATCH.get(event.type)
+        if handler is not None:
+            handler(self, event.data)
 
 
 def console_hooks(
     *,
-    color: bool = True,
+    color: bool | None = None,
     verbose: bool = False,
     file: TextIO | None = None,
 ) -> Hooks:
@@ -1,6 +1,56 @@
 from __future__ import annotations
 
+import functools
 import re
+from collections.abc import Iterator
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_search(pattern: str) -> re.Pattern[str]:
+    """Compile a search pattern, falling back to a literal match if invalid.
+
+    ``MULTILINE`` keeps ``^``/``$`` anchored to lines, since patterns are
+    matched against whole entries rather than one line at a time.
+    """
+    try:
+        return re.compile(pattern, re.MULTILINE)
+    except re.error:
+        return re.compile(re.escape(pattern), re.MULTILINE)
+
+
+# Line boundaries ``str.splitlines`` honours besides a newline
+_OTHER_LINE_BREAKS = re.compile("[\r\x0b\x0c\x1c-\x1e\x85\u2028\u2029]")
+
+
+def _matching_lines(regex: re.Pattern[str], text: str) -> list[str]:
+    """Return the lines of *text* that contain a match for *regex*.
+
+    Lines are those of ``str.splitlines``.  Text broken only by newlines,
+    the usual case, is scanned whole with the C-level matcher and only the
+    matching lines are sliced out; text with any other boundary (carriage
+    return, form feed, U+2028 ...) is split with ``splitlines`` and tested
+    line by line.
+    """
+    if _OTHER_LINE_BREAKS.search(text):
+        return [line for line in text.splitlines() if regex.search(line)]
+    lines: list[str] = []
+    pos = 0
+    size = len(text)
+    while pos < size:
+        match = regex.search(text, pos)
+        if match is None:
+            break
+        start = text.rfind("\n", 0, match.start()) + 1
+        end = text.find("\n", match.start())
+        if end == -1:
+            end = size
+        line = text[start:end]
+        # A match running past the end of its line (e.g. ``\s+`` over the
+        # newline) only counts if the line matches on its own
+        if match.end() <= end or regex.search(line):
+            lines.append(line)
+        pos = end + 1
+    return lines
 
 
 class SharedContext:
@@ -9,10 +59,26 @@ class SharedContext:
     def __init__(self) -> None:
         self._full: dict[str, str] = {}
         self._summaries: dict[str, str] = {}
+        # Rendered format_for_prompt sections, rebuilt only when a key is set
+        self._full_sections: dict[str, str] = {}
+        self._summary_sections: dict[str, str] = {}
+        # Bumped on every write; renderings memoised per expand set are
+        # valid only for the version they were built at
+        self._version = 0
+        self._fmt_cache: dict[frozenset[str] | None, tuple[int, str]] = {}
+
+    @property
+    def version(self) -> int:
+        """Counter incremented on every :meth:`set`."""
+        return self._version
 
     def set(self, key: str, value: str, *, summary: str | None = None) -> None:
         self._full[key] = value
         self._summaries[key] = summary if summary is not None else value
+        self._full_sections[key] = f"## {key}\n{value}"
+        self._summary_sections[key] = f"## {key} (summary)\n{self._summaries[key]}"
+        self._version += 1
+        self._fmt_cache.clear()
 
     def get(self, key: str) -> str | None:
         return self._full.get(key)
@@ -27,47 +93,82 @@ class SharedContext:
         all other keys show summaries. When *expand* is ``None``
         (the default), every key shows its full output for backward
         compatibility.
+
+        Renderings are memoised per *expand* set until the context
+        changes, so agents and retries asking for the same view reuse
+        the identical string.
         """
         if not self._full:
             return ""
-        sections = []
-        for name in self._full:
-            if expand is None or name in expand:
-                content = self._full[name]
-                sections.append(f"## {name}\n{content}")
-            else:
-                content = self._summaries[name]
-                sections.append(f"## {name} (summary)\n{content}")
-        return "\n\n".join(sections)
+        expand_key = frozenset(expand) if expand is not None else None
+        if expand_key is not None and expand_key.issuperset(self._full):
+            # Every entry expanded: same rendering (and memo slot) as None
+            expand_key = None
+        cached = self._fmt_cache.get(expand_key)
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+        full_sections = self._full_sections
+        if expand_key is None:
+            rendered = "\n\n".join(full_sections.values())
+        else:
+            summary_sections = self._summary_sections
+            rendered = "\n\n".join(
+                [
+                    full_sections[name]
+                    if name in expand_key
+                    else summary_sections[name]
+                    for name in full_sections
+                ]
+            )
+        self._fmt_cache[expand_key] = (self._version, rendered)
+        return rendered
 
     def keys(self) -> list[str]:
         """Return all entry keys in insertion order."""
-        return list(self._full.keys())
+        return list(self._full)
 
     def search(self, pattern: str) -> dict[str, list[str]]:
         """Search across all full entries, returning matching lines by agent name.
 
         Falls back to substring matching if *pattern* is not a valid regex.
         """
-        try:
-            regex = re.compile(pattern)
-        except re.error:
-            regex = re.compile(re.escape(pattern))
+        regex = _compile_search(pattern)
 
         results: dict[str, list[str]] = {}
         for key, value in self._full.items():
-            matches = [line for line in value.splitlines() if regex.search(line)]
+            matches = _matching_lines(regex, value)
             if matches:
                 results[key] = matches
         return results
 
     def entries(self) -> list[tuple[str, str, str, int]]:
         """Return ``(key, summary, full, char_count)`` tuples for all entries."""
+        summaries = self._summaries
         return [
-            (key, self._summaries[key], self._full[key], len(self._full[key]))
-            for key in self._full
+            (key, summaries[key], full, len(full)) for key, full in self._full.items()
         ]
 
+    def index(self) -> list[tuple[str, str, int]]:
+        """Return ``(key, summary, char_count)`` rows without the full outputs.
+
+        Use this instead of :meth:`entries` when only the catalogue of what
+        is available is needed; full outputs are fetched on demand with
+        :meth:`get`.
+        """
+        return [
+            (key, self._summaries[key], len(full)) for key, full in self._full.items()
+        ]
+
+    def __len__(self) -> int:
+        return len(self._full)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._full
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over entry keys in insertion order, without copying them."""
+        return iter(self._full)
+
     def to_dict(self) -> dict[str, str]:
         return dict(self._full)
 
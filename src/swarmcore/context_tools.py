@@ -1,57 +1,75 @@
 from __future__ import annotations
 
-from typing import Any, Callable
+from typing import Any, Callable, TypeVar
 
 from swarmcore.context import SharedContext
 
+_F = TypeVar("_F", bound=Callable[..., Any])
 
-def make_list_context_tool(ctx: SharedContext) -> Callable[[], str]:
-    """Create a ``list_context`` tool bound to the given context."""
+_INLINE_ATTR = "_swarmcore_inline"
+
+
+def _inline_tool(func: _F) -> _F:
+    """Mark *func* to run on the event loop instead of in a worker thread.
+
+    Only for cheap, non-blocking tools that read :class:`SharedContext`:
+    parallel agents write the context from the loop, so iterating it from a
+    worker thread could see the dict change size mid-loop.
+    """
+    setattr(func, _INLINE_ATTR, True)
+    return func
+
+
+def _runs_inline(func: Callable[..., Any]) -> bool:
+    """True when *func* was marked with :func:`_inline_tool`."""
+    return getattr(func, _INLINE_ATTR, False) is True
+
+
+class ContextTools:
+    """Pull-mode context tools, exposed as methods bound to one context.
 
-    def list_context() -> str:
+    Bound methods share their function (and so their cached tool schema)
+    across every instance, so building tools per swarm run is cheap.
+    """
+
+    def __init__(self, ctx: SharedContext) -> None:
+        self._ctx = ctx
+
+    @_inline_tool
+    def list_context(self) -> str:
         """List all available agent outputs with summaries and sizes.
 
         Returns a markdown listing of agent names, their one-line summaries,
         and character counts.  Call this to discover what prior agent outputs
         are available before retrieving them.
         """
-        entries = ctx.entries()
-        if not entries:
+        rows = self._ctx.index()
+        if not rows:
             return "No agent outputs available yet."
-        lines = []
-        for name, summary, _full, char_count in entries:
-            lines.append(f"- **{name}** ({char_count} chars): {summary}")
-        return "\n".join(lines)
-
-    return list_context
-
-
-def make_get_context_tool(ctx: SharedContext) -> Callable[[str], str]:
-    """Create a ``get_context`` tool bound to the given context."""
+        return "\n".join(
+            f"- **{name}** ({char_count} chars): {summary}"
+            for name, summary, char_count in rows
+        )
 
-    def get_context(agent_name: str) -> str:
+    @_inline_tool
+    def get_context(self, agent_name: str) -> str:
         """Retrieve the full output from a prior agent.
 
         agent_name: The name of the agent whose full output you want
         """
+        ctx = self._ctx
         full = ctx.get(agent_name)
         if full is not None:
             return full
-        available = ctx.keys()
-        if not available:
+        if not ctx:
             return "No agent outputs available yet."
         return (
             f"No context found for agent '{agent_name}'. "
-            f"Available agents: {', '.join(available)}"
+            f"Available agents: {', '.join(ctx)}"
         )
 
-    return get_context
-
-
-def make_search_context_tool(ctx: SharedContext) -> Callable[[str], str]:
-    """Create a ``search_context`` tool bound to the given context."""
-
-    def search_context(query: str) -> str:
+    @_inline_tool
+    def search_context(self, query: str) -> str:
         """Search across all prior agent outputs for lines matching a pattern.
 
         Returns matching lines grouped by agent name.  The query is a regex
@@ -61,21 +79,30 @@ def make_search_context_tool(ctx: SharedContext) -> Callable[[str], str]:
 
         query: Regex pattern or keyword to search for (case-sensitive)
         """
-        results = ctx.search(query)
+        results = self._ctx.search(query)
         if not results:
             return f"No matches found for '{query}'."
-        sections: list[str] = []
-        for name, lines in results.items():
-            sections.append(f"**{name}**:\n" + "\n".join(f"  {line}" for line in lines))
-        return "\n\n".join(sections)
+        return "\n\n".join(
+            f"**{name}**:\n  " + "\n  ".join(lines) for name, lines in results.items()
+        )
+
 
-    return search_context
+def make_list_context_tool(ctx: SharedContext) -> Callable[[], str]:
+    """Create a ``list_context`` tool bound to the given context."""
+    return ContextTools(ctx).list_context
+
+
+def make_get_context_tool(ctx: SharedContext) -> Callable[[str], str]:
+    """Create a ``get_context`` tool bound to the given context."""
+    return ContextTools(ctx).get_context
+
+
+def make_search_context_tool(ctx: SharedContext) -> Callable[[str], str]:
+    """Create a ``search_context`` tool bound to the given context."""
+    return ContextTools(ctx).search_context
 
 
 def make_context_tools(ctx: SharedContext) -> list[Callable[..., Any]]:
     """Create all pull-mode context tools bound to the given context."""
-    return [
-        make_list_context_tool(ctx),
-        make_get_context_tool(ctx),
-        make_search_context_tool(ctx),
-    ]
+    tools = ContextTools(ctx)
+    return [tools.list_context, tools.get_context, tools.search_context]
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from swarmcore.exceptions import SwarmError
@@ -48,8 +50,9 @@ class Flow:
     group runs its own steps sequentially within that concurrent group.
     """
 
-    def __init__(self, steps: list[Agent | list[Agent | Flow]]) -> None:
-        self._steps: list[Agent | list[Agent | Flow]] = list(steps)
+    def __init__(self, steps: Sequence[Agent | list[Agent | Flow]]) -> None:
+        # Tuple backbone: operators extend it with a single concatenation
+        self._steps: tuple[Agent | list[Agent | Flow], ...] = tuple(steps)
 
     @property
     def steps(self) -> list[Agent | list[Agent | Flow]]:
@@ -58,13 +61,18 @@ class Flow:
     @property
     def agents(self) -> list[Agent]:
         """All unique agents in step order, recursing into sub-flows."""
+        return list(self._unique_agents)
+
+    @cached_property
+    def _unique_agents(self) -> tuple[Agent, ...]:
+        # Steps never change after construction, so the walk runs once
         seen: set[str] = set()
         result: list[Agent] = []
         for step in self._steps:
             if isinstance(step, list):
                 for item in step:
                     if isinstance(item, Flow):
-                        for agent in item.agents:
+                        for agent in item._unique_agents:
                             if agent.name not in seen:
                                 seen.add(agent.name)
                                 result.append(agent)
@@ -76,13 +84,13 @@ class Flow:
                 if step.name not in seen:
                     seen.add(step.name)
                     result.append(step)
-        return result
+        return tuple(result)
 
     def __rshift__(self, other: Agent | Flow) -> Flow:
         from swarmcore.agent import Agent
 
         if isinstance(other, Agent):
-            return Flow(self._steps + [other])
+            return Flow(self._steps + (other,))
         if isinstance(other, Flow):
             return Flow(self._steps + other._steps)
         return NotImplemented
@@ -100,26 +108,25 @@ class Flow:
         # extend it.  Otherwise combine self_items + other_items.
         if self._steps and isinstance(self._steps[-1], list):
             # self ends with a parallel group — extend it
-            new_steps: list[Agent | list[Agent | Flow]] = list(self._steps)
-            new_steps[-1] = list(self._steps[-1]) + other_items
-            return Flow(new_steps)
+            return Flow(self._steps[:-1] + (self._steps[-1] + other_items,))
 
         return Flow([self_items + other_items])
 
+    def _inner_repr(self) -> str:
+        """Render the steps without the ``Flow(...)`` wrapper."""
+        return " >> ".join(
+            f"[{', '.join(_item_repr(item) for item in step)}]"
+            if isinstance(step, list)
+            else step.name
+            for step in self._steps
+        )
+
     def __repr__(self) -> str:
-        parts: list[str] = []
-        for step in self._steps:
-            if isinstance(step, list):
-                item_strs: list[str] = []
-                for item in step:
-                    if isinstance(item, Flow):
-                        item_strs.append(f"({repr(item)[5:-1]})")
-                    else:
-                        item_strs.append(item.name)
-                parts.append(f"[{', '.join(item_strs)}]")
-            else:
-                parts.append(step.name)
-        return f"Flow({' >> '.join(parts)})"
+        return f"Flow({self._inner_repr()})"
+
+
+def _item_repr(item: Agent | Flow) -> str:
+    return f"({item._inner_repr()})" if isinstance(item, Flow) else item.name
 
 
 def chain(*items: Agent | _ParallelGroup) -> Flow:
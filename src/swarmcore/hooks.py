@@ -2,10 +2,14 @@ from __future__ import annotations
 
 import asyncio
 import dataclasses
+import functools
+import inspect
 import logging
-from dataclasses import dataclass, field
-from enum import Enum
-from typing import Any, Callable
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from enum import StrEnum
+from types import MappingProxyType
+from typing import Any
 
 logger = logging.getLogger("swarmcore")
 
@@ -13,7 +17,7 @@ logger = logging.getLogger("swarmcore")
 Handler = Callable[["Event"], Any]
 
 
-class EventType(Enum):
+class EventType(StrEnum):
     SWARM_START = "swarm_start"
     SWARM_END = "swarm_end"
     STEP_START = "step_start"
@@ -24,6 +28,7 @@ class EventType(Enum):
     AGENT_RETRY = "agent_retry"
     LLM_CALL_START = "llm_call_start"
     LLM_CALL_END = "llm_call_end"
+    LLM_TOKEN = "llm_token"
     TOOL_CALL_START = "tool_call_start"
     TOOL_CALL_END = "tool_call_end"
 
@@ -33,7 +38,7 @@ class EventType(Enum):
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class _EventDataBase:
     """Base for typed event data with dict-like backward compatibility."""
 
@@ -43,69 +48,79 @@ class _EventDataBase:
 
     def __getitem__(self, key: str) -> Any:
         """Dict-compatible `[]` access — raises `KeyError` on miss."""
-        try:
+        if key in self._field_name_set():
             return getattr(self, key)
-        except AttributeError:
-            raise KeyError(key) from None
+        raise KeyError(key)
+
+    @classmethod
+    @functools.cache
+    def _field_names(cls) -> tuple[str, ...]:
+        """Field names of this event class, computed once per class."""
+        return tuple(f.name for f in dataclasses.fields(cls))
+
+    @classmethod
+    @functools.cache
+    def _field_name_set(cls) -> frozenset[str]:
+        return frozenset(cls._field_names())
 
     def __iter__(self):  # type: ignore[override]
         """Iterate over field names (dict-key protocol for logging `extra=`)."""
-        return iter(f.name for f in dataclasses.fields(self))
+        return iter(self._field_names())
 
     def __contains__(self, key: str) -> bool:
         """Support `key in data` checks."""
-        return hasattr(self, key) and key in {f.name for f in dataclasses.fields(self)}
+        return key in self._field_name_set()
 
     def items(self) -> list[tuple[str, Any]]:
         """Return all fields as `(key, value)` pairs."""
-        return list(dataclasses.asdict(self).items())
+        return [(name, getattr(self, name)) for name in self._field_names()]
 
 
-@dataclass
+@dataclass(slots=True)
 class SwarmStartData(_EventDataBase):
     task: str
     step_count: int
 
 
-@dataclass
+@dataclass(slots=True)
 class SwarmEndData(_EventDataBase):
     duration_seconds: float
     agent_count: int
     total_cost: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class StepStartData(_EventDataBase):
     step_index: int
     agents: list[str]
     parallel: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class StepEndData(_EventDataBase):
     step_index: int
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentStartData(_EventDataBase):
     agent: str
     task: str
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentEndData(_EventDataBase):
     agent: str
     duration_seconds: float
     cost: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentErrorData(_EventDataBase):
     agent: str
     error: str
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentRetryData(_EventDataBase):
     agent: str
     attempt: int
@@ -114,13 +129,13 @@ class AgentRetryData(_EventDataBase):
     delay: float
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMCallStartData(_EventDataBase):
     agent: str
     call_index: int
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMCallEndData(_EventDataBase):
     agent: str
     call_index: int
@@ -131,14 +146,21 @@ class LLMCallEndData(_EventDataBase):
     total_tokens: int
 
 
-@dataclass
+@dataclass(slots=True)
+class LLMTokenData(_EventDataBase):
+    agent: str
+    call_index: int
+    text: str
+
+
+@dataclass(slots=True)
 class ToolCallStartData(_EventDataBase):
     agent: str
     tool: str
     arguments: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCallEndData(_EventDataBase):
     agent: str
     tool: str
@@ -156,15 +178,27 @@ EventData = (
     | AgentRetryData
     | LLMCallStartData
     | LLMCallEndData
+    | LLMTokenData
     | ToolCallStartData
     | ToolCallEndData
 )
 
 
-@dataclass
+# Shared read-only payload for events emitted without data
+_EMPTY_DATA: Mapping[str, Any] = MappingProxyType({})
+
+
+@dataclass(slots=True)
 class Event:
     type: EventType
-    data: EventData | dict[str, Any] = field(default_factory=dict)
+    data: EventData | Mapping[str, Any] = _EMPTY_DATA
+
+
+def _is_async(handler: Handler) -> bool:
+    """True when *handler* is known to return a coroutine."""
+    return inspect.iscoroutinefunction(handler) or inspect.iscoroutinefunction(
+        type(handler).__call__
+    )
 
 
 class Hooks:
@@ -173,19 +207,39 @@ class Hooks:
     def __init__(self) -> None:
         self._handlers: dict[EventType, list[Handler]] = {}
         self._global_handlers: list[Handler] = []
+        # Per-type ``(handler, is_async)`` tuples (global first, then
+        # type-specific), rebuilt on registration so ``emit`` does a single
+        # lookup.  Types with no handlers are absent.
+        self._dispatch: dict[EventType, tuple[tuple[Handler, bool], ...]] = {}
+        # Async handler invocations scheduled by ``emit_nowait``
+        self._pending: set[asyncio.Task[None]] = set()
 
     def on(self, event_type: EventType, handler: Handler) -> None:
         """Register a handler for a specific event type."""
         self._handlers.setdefault(event_type, []).append(handler)
+        self._rebuild_dispatch()
 
     def on_all(self, handler: Handler) -> None:
         """Register a handler that receives all events."""
         self._global_handlers.append(handler)
+        self._rebuild_dispatch()
+
+    def _rebuild_dispatch(self) -> None:
+        dispatch: dict[EventType, tuple[tuple[Handler, bool], ...]] = {}
+        for event_type in EventType:
+            handlers = (*self._global_handlers, *self._handlers.get(event_type, ()))
+            if handlers:
+                dispatch[event_type] = tuple((h, _is_async(h)) for h in handlers)
+        self._dispatch = dispatch
 
     @property
     def is_active(self) -> bool:
         """True when at least one handler is registered."""
-        return bool(self._global_handlers) or any(self._handlers.values())
+        return bool(self._dispatch)
+
+    def is_subscribed(self, event_type: EventType) -> bool:
+        """True when at least one handler will receive *event_type*."""
+        return event_type in self._dispatch
 
     async def emit(self, event: Event) -> None:
         """Dispatch an event to registered handlers.
@@ -193,15 +247,58 @@ class Hooks:
         Supports both sync and async handlers. Handler exceptions are
         logged and swallowed so they never break the execution flow.
         """
-        handlers = list(self._global_handlers)
-        handlers.extend(self._handlers.get(event.type, []))
+        handlers = self._dispatch.get(event.type)
+        if handlers is None:
+            return
 
-        for handler in handlers:
+        for handler, is_async in handlers:
             try:
+                if is_async:
+                    await handler(event)
+                    continue
                 result = handler(event)
-                if asyncio.iscoroutine(result):
+                # Sync handlers normally return None; anything else may still
+                # be a coroutine from a callable we could not classify
+                if result is not None and asyncio.iscoroutine(result):
                     await result
             except Exception:
                 logger.exception(
-                    "Hook handler %r failed for event %s", handler, event.type.value
+                    "Hook handler %r failed for event %s", handler, event.type
                 )
+
+    def emit_nowait(self, event: Event) -> None:
+        """Dispatch an event without suspending the caller.
+
+        Sync handlers run inline.  Coroutines returned by async handlers
+        are scheduled as tasks and tracked until :meth:`drain`, so events
+        on hot paths do not each cost an event-loop round trip.  Handler
+        exceptions are logged and swallowed, as with :meth:`emit`.
+        """
+        handlers = self._dispatch.get(event.type)
+        if handlers is None:
+            return
+
+        for handler, _ in handlers:
+            try:
+                result = handler(event)
+            except Exception:
+                logger.exception(
+                    "Hook handler %r failed for event %s", handler, event.type
+                )
+                continue
+            if result is not None and asyncio.iscoroutine(result):
+                task = asyncio.create_task(self._await_handler(handler, result, event))
+                self._pending.add(task)
+                task.add_done_callback(self._pending.discard)
+
+    @staticmethod
+    async def _await_handler(handler: Handler, coro: Any, event: Event) -> None:
+        try:
+            await coro
+        except Exception:
+            logger.exception("Hook handler %r failed for event %s", handler, event.type)
+
+    async def drain(self) -> None:
+        """Wait for async handlers scheduled by :meth:`emit_nowait` to finish."""
+        while self._pending:
+            await asyncio.gather(*self._pending)
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import dataclasses
 import logging
+from collections.abc import Mapping
 from typing import Any
 
-from swarmcore.hooks import Event, EventType, Hooks
+from swarmcore.hooks import Event, EventType, Hooks, _EventDataBase
 
 _INFO_EVENTS = {
     EventType.SWARM_START,
@@ -18,6 +19,7 @@ _INFO_EVENTS = {
 _DEBUG_EVENTS = {
     EventType.LLM_CALL_START,
     EventType.LLM_CALL_END,
+    EventType.LLM_TOKEN,
     EventType.TOOL_CALL_START,
     EventType.TOOL_CALL_END,
 }
@@ -26,37 +28,71 @@ _ERROR_EVENTS = {
     EventType.AGENT_ERROR,
 }
 
+# Log level per event type; anything not listed logs at INFO
+_LEVEL_BY_EVENT: dict[EventType, int] = (
+    {t: logging.INFO for t in _INFO_EVENTS}
+    | {t: logging.DEBUG for t in _DEBUG_EVENTS}
+    | {t: logging.ERROR for t in _ERROR_EVENTS}
+)
+
+# Fields echoed in the human-readable message, in order, with their format
+_SUMMARY_FIELDS: tuple[tuple[str, str], ...] = (
+    ("agent", "{}"),
+    ("tool", "{}"),
+    ("step_index", "step {}"),
+    ("duration_seconds", "{:.2f}s"),
+    ("error", "error: {}"),
+)
+
+
+def _summary(fields: Mapping[str, Any]) -> str:
+    """Short message text: agent, tool, step, duration and error when present."""
+    parts: list[str] = []
+    for name, fmt in _SUMMARY_FIELDS:
+        if name not in fields:
+            continue
+        value = fields[name]
+        # Plain-dict payloads may carry any value; only numbers get ``:.2f``
+        if name == "duration_seconds" and not isinstance(value, (int, float)):
+            fmt = "{}"
+        parts.append(fmt.format(value))
+    return " ".join(parts)
+
 
 class LoggingHandler:
     """Hook handler that logs events via Python's ``logging`` module.
 
     Swarm/agent lifecycle events are logged at ``INFO``, LLM and tool call
-    events at ``DEBUG``, and errors at ``ERROR``.  All event data is passed
-    via the ``extra`` dict for structured log formatters.
+    events at ``DEBUG``, and errors at ``ERROR``.  The log message is the
+    event name plus a short summary (agent, duration, error); all event data
+    is passed via the ``extra`` dict for structured log formatters.
     """
 
     def __init__(self) -> None:
         self._logger = logging.getLogger("swarmcore")
 
     @staticmethod
-    def _as_extra(data: Any) -> dict[str, Any]:
+    def _as_extra(data: Any) -> Mapping[str, Any]:
         """Convert event data to a dict suitable for logging ``extra``."""
-        if isinstance(data, dict):
+        if isinstance(data, Mapping):
             return data
+        if isinstance(data, _EventDataBase):
+            # Shallow copy: asdict() would deep-copy every nested value
+            return {name: getattr(data, name) for name in data._field_names()}
         if dataclasses.is_dataclass(data) and not isinstance(data, type):
             return dataclasses.asdict(data)
         return {}
 
     def __call__(self, event: Event) -> None:
-        event_name = event.type.value
-        extra = self._as_extra(event.data)
+        level = _LEVEL_BY_EVENT.get(event.type, logging.INFO)
+        # Skip building ``extra`` for records the logger would drop anyway
+        if not self._logger.isEnabledFor(level):
+            return
 
-        if event.type in _ERROR_EVENTS:
-            self._logger.error("[%s] %s", event_name, event.data, extra=extra)
-        elif event.type in _DEBUG_EVENTS:
-            self._logger.debug("[%s] %s", event_name, event.data, extra=extra)
-        else:
-            self._logger.info("[%s] %s", event_name, event.data, extra=extra)
+        # The message stays short; the full payload travels in ``extra`` so
+        # structured formatters do not serialise it twice
+        extra = self._as_extra(event.data)
+        self._logger.log(level, "[%s] %s", event.type, _summary(extra), extra=extra)
 
 
 def enable_logging(level: int = logging.INFO) -> Hooks:
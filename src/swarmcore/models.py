@@ -1,15 +1,71 @@
 from __future__ import annotations
 
 import sys
-from typing import TextIO
+from collections.abc import Iterable
+from typing import Self, TextIO
 
 from pydantic import BaseModel, Field
 
 
+def _int_or_zero(value: object) -> int:
+    return value if isinstance(value, int) else 0
+
+
 class TokenUsage(BaseModel):
     prompt_tokens: int = 0
     completion_tokens: int = 0
     total_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_creation_tokens: int = 0
+
+    @classmethod
+    def from_usage(cls, usage: object) -> TokenUsage:
+        """Build from a provider usage object (e.g. LiteLLM's ``Usage``).
+
+        Missing or non-integer cache counts are read as zero.
+        """
+        if not usage:
+            return cls()
+        details = getattr(usage, "prompt_tokens_details", None)
+        return cls(
+            prompt_tokens=getattr(usage, "prompt_tokens", 0) or 0,
+            completion_tokens=getattr(usage, "completion_tokens", 0) or 0,
+            total_tokens=getattr(usage, "total_tokens", 0) or 0,
+            cache_read_tokens=_int_or_zero(getattr(details, "cached_tokens", None)),
+            cache_creation_tokens=_int_or_zero(
+                getattr(usage, "cache_creation_input_tokens", None)
+            ),
+        )
+
+    @classmethod
+    def total(cls, usages: Iterable[TokenUsage]) -> TokenUsage:
+        """Sum *usages* into a new instance.
+
+        Folds into local integers and builds the result once, instead of
+        assigning every field on a Pydantic model per item as ``+=`` does.
+        """
+        prompt = completion = total = cache_read = cache_creation = 0
+        for usage in usages:
+            prompt += usage.prompt_tokens
+            completion += usage.completion_tokens
+            total += usage.total_tokens
+            cache_read += usage.cache_read_tokens
+            cache_creation += usage.cache_creation_tokens
+        return cls.model_construct(
+            prompt_tokens=prompt,
+            completion_tokens=completion,
+            total_tokens=total,
+            cache_read_tokens=cache_read,
+            cache_creation_tokens=cache_creation,
+        )
+
+    def __iadd__(self, other: TokenUsage) -> Self:
+        self.prompt_tokens += other.prompt_tokens
+        self.completion_tokens += other.completion_tokens
+        self.total_tokens += other.total_tokens
+        self.cache_read_tokens += other.cache_read_tokens
+        self.cache_creation_tokens += other.cache_creation_tokens
+        return self
 
 
 class ToolCallRecord(BaseModel):
@@ -41,6 +97,7 @@ class AgentResult(BaseModel):
     llm_call_count: int = 0
     tool_call_count: int = 0
     cost: float = 0.0
+    cached: bool = False
 
 
 class SwarmResult(BaseModel):
@@ -56,12 +113,13 @@ class SwarmResult(BaseModel):
         if not self.history:
             return ""
 
-        name_width = max(len(r.agent_name) for r in self.history)
-        name_width = max(name_width, 5)  # minimum width for "TOTAL"
-
-        show_cost = any(r.cost > 0 for r in self.history)
+        # One pass for the layout decisions before rendering rows.
+        name_width = 5  # minimum width for "TOTAL"
+        show_cost = False
+        for r in self.history:
+            name_width = max(name_width, len(r.agent_name))
+            show_cost = show_cost or r.cost > 0
 
-        lines: list[str] = []
         header = (
             f"  {'Agent':<{name_width}}  {'Tokens':>7}  "
             f"{'Calls':>5}  {'Tools':>5}  {'Duration':>8}"
@@ -70,11 +128,9 @@ class SwarmResult(BaseModel):
         if show_cost:
             header += f"  {'Cost':>9}"
             rule_width += 11
-        lines.append(header)
         rule = "  " + "\u2500" * rule_width
-        lines.append(rule)
 
-        for r in self.history:
+        def row(r: AgentResult) -> str:
             line = (
                 f"  {r.agent_name:<{name_width}}  {r.token_usage.total_tokens:>7,}  "
                 f"{r.llm_call_count:>5}  {r.tool_call_count:>5}  "
@@ -83,9 +139,10 @@ class SwarmResult(BaseModel):
             if show_cost:
                 cost_str = f"${r.cost:.4f}"
                 line += f"  {cost_str:>9}"
-            lines.append(line)
+            return line
+
+        rows = [row(r) for r in self.history]
 
-        lines.append(rule)
         total_line = (
             f"  {'TOTAL':<{name_width}}  {self.total_token_usage.total_tokens:>7,}  "
             f"{'':>5}  {'':>5}  {self.duration_seconds:>7.1f}s"
@@ -93,8 +150,7 @@ class SwarmResult(BaseModel):
         if show_cost:
             total_cost_str = f"${self.total_cost:.4f}"
             total_line += f"  {total_cost_str:>9}"
-        lines.append(total_line)
-        return "\n".join(lines)
+        return "\n".join([header, rule, *rows, rule, total_line])
 
     def context_pull_report(self) -> str:
         """Analyze which agents pulled context from which others (pull mode).
@@ -104,24 +160,25 @@ class SwarmResult(BaseModel):
         lines: list[str] = []
         name_width = max((len(r.agent_name) for r in self.history), default=5)
 
-        for i, r in enumerate(self.history):
+        # Names of agents that ran before the current entry, built up as we go
+        # so each entry doesn't re-slice and re-scan the history.
+        prior_names: list[str] = []
+        for r in self.history:
+            name = r.agent_name
             pulls = [
                 tc.arguments.get("agent_name", "?")
                 for tc in r.tool_calls
                 if tc.tool_name == "get_context"
             ]
-            if not pulls:
-                continue
-
-            prior = [
-                h.agent_name for h in self.history[:i] if h.agent_name != r.agent_name
-            ]
+            prior = [n for n in prior_names if n != name] if pulls else []
+            prior_names.append(name)
             if not prior:
                 continue
 
+            pulled = {p for p in pulls if isinstance(p, str)}
             tag = "SELECTIVE \u2713" if len(pulls) < len(prior) else "PULLED ALL \u26a0"
-            skipped = [a for a in prior if a not in pulls]
-            line = f"  {r.agent_name:<{name_width}}  {len(pulls)}/{len(prior)} pulled  {tag}"
+            skipped = [a for a in prior if a not in pulled]
+            line = f"  {name:<{name_width}}  {len(pulls)}/{len(prior)} pulled  {tag}"
             if skipped:
                 line += f"  (skipped: {', '.join(skipped)})"
             lines.append(line)
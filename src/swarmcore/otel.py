@@ -36,14 +36,14 @@ class OTelHandler:
                 └── llm.call[0]
 
     Handles parallel agents correctly by keying active spans on composite
-    string identifiers rather than assuming sequential execution.
+    tuple identifiers rather than assuming sequential execution.
     """
 
     def __init__(self) -> None:
-        self._spans: dict[str, Any] = {}
-
-    def _key(self, *parts: str | int) -> str:
-        return ":".join(str(p) for p in parts)
+        # Keys are tuples such as ("agent", name) or ("llm", name, index)
+        self._spans: dict[tuple[str | int, ...], Any] = {}
+        # Open step spans, innermost last; the top parents new agent spans
+        self._step_stack: list[Any] = []
 
     def __call__(self, event: Event) -> None:
         data = event.data
@@ -52,10 +52,10 @@ class OTelHandler:
             span = _tracer.start_span("swarm.run")
             span.set_attribute("swarm.task", data.get("task", ""))
             span.set_attribute("swarm.step_count", data.get("step_count", 0))
-            self._spans["swarm"] = span
+            self._spans[("swarm",)] = span
 
         elif event.type is EventType.SWARM_END:
-            span = self._spans.pop("swarm", None)
+            span = self._spans.pop(("swarm",), None)
             if span:
                 span.set_attribute(
                     "swarm.duration_seconds", data.get("duration_seconds", 0)
@@ -64,34 +64,34 @@ class OTelHandler:
 
         elif event.type is EventType.STEP_START:
             idx = data.get("step_index", 0)
-            parent = self._spans.get("swarm")
+            parent = self._spans.get(("swarm",))
             ctx = trace.set_span_in_context(parent) if parent else None
             span = _tracer.start_span(f"swarm.step[{idx}]", context=ctx)
             span.set_attribute("step.parallel", data.get("parallel", False))
-            self._spans[self._key("step", idx)] = span
+            self._spans[("step", idx)] = span
+            self._step_stack.append(span)
 
         elif event.type is EventType.STEP_END:
             idx = data.get("step_index", 0)
-            span = self._spans.pop(self._key("step", idx), None)
+            span = self._spans.pop(("step", idx), None)
             if span:
+                if self._step_stack and self._step_stack[-1] is span:
+                    self._step_stack.pop()
+                elif span in self._step_stack:
+                    self._step_stack.remove(span)
                 span.end()
 
         elif event.type is EventType.AGENT_START:
             agent = data.get("agent", "")
-            # Find the current step span as parent
-            parent = None
-            for key in reversed(list(self._spans)):
-                if key.startswith("step:"):
-                    parent = self._spans[key]
-                    break
+            parent = self._step_stack[-1] if self._step_stack else None
             ctx = trace.set_span_in_context(parent) if parent else None
             span = _tracer.start_span(f"agent.{agent}", context=ctx)
             span.set_attribute("agent.task", data.get("task", ""))
-            self._spans[self._key("agent", agent)] = span
+            self._spans[("agent", agent)] = span
 
         elif event.type is EventType.AGENT_END:
             agent = data.get("agent", "")
-            span = self._spans.pop(self._key("agent", agent), None)
+            span = self._spans.pop(("agent", agent), None)
             if span:
                 span.set_attribute(
                     "agent.duration_seconds", data.get("duration_seconds", 0)
@@ -100,7 +100,7 @@ class OTelHandler:
 
         elif event.type is EventType.AGENT_ERROR:
             agent = data.get("agent", "")
-            span = self._spans.pop(self._key("agent", agent), None)
+            span = self._spans.pop(("agent", agent), None)
             if span:
                 span.set_attribute("error", True)
                 span.set_attribute("error.message", data.get("error", ""))
@@ -109,15 +109,15 @@ class OTelHandler:
         elif event.type is EventType.LLM_CALL_START:
             agent = data.get("agent", "")
             idx = data.get("call_index", 0)
-            parent = self._spans.get(self._key("agent", agent))
+            parent = self._spans.get(("agent", agent))
             ctx = trace.set_span_in_context(parent) if parent else None
             span = _tracer.start_span(f"llm.call[{idx}]", context=ctx)
-            self._spans[self._key("llm", agent, idx)] = span
+            self._spans[("llm", agent, idx)] = span
 
         elif event.type is EventType.LLM_CALL_END:
             agent = data.get("agent", "")
             idx = data.get("call_index", 0)
-            span = self._spans.pop(self._key("llm", agent, idx), None)
+            span = self._spans.pop(("llm", agent, idx), None)
             if span:
                 span.set_attribute("llm.finish_reason", data.get("finish_reason", ""))
                 span.set_attribute(
@@ -128,15 +128,15 @@ class OTelHandler:
         elif event.type is EventType.TOOL_CALL_START:
             agent = data.get("agent", "")
             tool = data.get("tool", "")
-            parent = self._spans.get(self._key("agent", agent))
+            parent = self._spans.get(("agent", agent))
             ctx = trace.set_span_in_context(parent) if parent else None
             span = _tracer.start_span(f"tool.{tool}", context=ctx)
-            self._spans[self._key("tool", agent, tool)] = span
+            self._spans[("tool", agent, tool)] = span
 
         elif event.type is EventType.TOOL_CALL_END:
             agent = data.get("agent", "")
             tool = data.get("tool", "")
-            span = self._spans.pop(self._key("tool", agent, tool), None)
+            span = self._spans.pop(("tool", agent, tool), None)
             if span:
                 span.set_attribute(
                     "tool.duration_seconds", data.get("duration_seconds", 0)
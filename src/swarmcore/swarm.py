@@ -1,15 +1,19 @@
 from __future__ import annotations
 
 import asyncio
-import re
+import os
+import random
+import threading
 import time
+import uuid
+from contextvars import ContextVar
 from typing import Awaitable, Callable, Literal, TypeVar
 
 from swarmcore.agent import Agent
 from swarmcore.context import SharedContext
-from swarmcore.context_tools import make_context_tools
-from swarmcore.flow import Flow
+from swarmcore.context_tools import _inline_tool, make_context_tools
 from swarmcore.exceptions import AgentError
+from swarmcore.flow import Flow
 from swarmcore.hooks import (
     AgentRetryData,
     Event,
@@ -24,7 +28,17 @@ from swarmcore.models import AgentResult, SwarmResult, TokenUsage
 
 _T = TypeVar("_T")
 
-_SUMMARY_RE = re.compile(r"<summary>(.*?)</summary>", re.DOTALL)
+# ``max_concurrency`` semaphore of the enclosing ``Swarm.run``.  Held in a
+# ContextVar so concurrent runs on one Swarm each get their own limit.
+_run_limit: ContextVar[asyncio.Semaphore | None] = ContextVar(
+    "_run_limit", default=None
+)
+
+# Identifier of the enclosing ``Swarm.run``, stamped on each history line
+_run_id: ContextVar[str] = ContextVar("_run_id", default="")
+
+_SUMMARY_OPEN = "<summary>"
+_SUMMARY_CLOSE = "</summary>"
 
 
 def _parse_structured_output(output: str) -> tuple[str, str]:
@@ -34,18 +48,79 @@ def _parse_structured_output(output: str) -> tuple[str, str]:
     the ``<summary>`` block removed.  If no tags are found, the full
     output is used for both summary and detail (graceful degradation).
     """
-    match = _SUMMARY_RE.search(output)
-    if not match:
+    start = output.find(_SUMMARY_OPEN)
+    if start == -1:
+        return output, output
+    body = start + len(_SUMMARY_OPEN)
+    end = output.find(_SUMMARY_CLOSE, body)
+    if end == -1:
         return output, output
-    summary = match.group(1).strip()
-    detail = (output[: match.start()] + output[match.end() :]).strip()
+    summary = output[body:end].strip()
+    detail = (output[:start] + output[end + len(_SUMMARY_CLOSE) :]).strip()
     return summary, detail
 
 
-def _make_expand_tool(context: SharedContext) -> Callable[[str], str]:
-    """Create an ``expand_context`` tool bound to the given context."""
+def _retry_after(error: BaseException) -> float | None:
+    """Return the provider's ``Retry-After`` hint in seconds, if any.
+
+    Walks *error*'s ``__cause__`` chain (``Agent.run`` wraps provider
+    errors in :class:`AgentError`) looking for a numeric ``retry_after``
+    attribute or a ``retry-after`` response header.  HTTP-date values
+    are ignored.
+    """
+    exc: BaseException | None = error
+    while exc is not None:
+        value = getattr(exc, "retry_after", None)
+        if value is None:
+            headers = getattr(getattr(exc, "response", None), "headers", None)
+            if headers is not None:
+                try:
+                    value = headers.get("retry-after")
+                except (AttributeError, TypeError, ValueError):
+                    value = None
+        if value is not None:
+            try:
+                seconds = float(value)
+            except (TypeError, ValueError):
+                pass
+            else:
+                if seconds >= 0:
+                    return seconds
+        exc = exc.__cause__
+    return None
+
+
+def _fit_to_budget(
+    rows: list[tuple[str, str, int]], budget: int
+) -> tuple[list[tuple[str, str, int]], list[tuple[str, str, int]]]:
+    """Split context index rows into those whose full output fits *budget* and the rest.
+
+    Rows are considered in order and kept while their combined character
+    count stays within *budget*; a row that does not fit is demoted, but
+    later, smaller rows may still be kept.
+    """
+    kept: list[tuple[str, str, int]] = []
+    demoted: list[tuple[str, str, int]] = []
+    used = 0
+    for row in rows:
+        if used + row[2] <= budget:
+            kept.append(row)
+            used += row[2]
+        else:
+            demoted.append(row)
+    return kept, demoted
 
-    def expand_context(agent_name: str) -> str:
+
+class _ExpandContextTool:
+    """Holds the ``expand_context`` tool as a method bound to one context."""
+
+    __slots__ = ("_context",)
+
+    def __init__(self, context: SharedContext) -> None:
+        self._context = context
+
+    @_inline_tool
+    def expand_context(self, agent_name: str) -> str:
         """Retrieve the full detailed output from a prior agent when its
         summary is not sufficient. Call this when you need to see the
         complete original output rather than just the summary shown in
@@ -53,15 +128,13 @@ def _make_expand_tool(context: SharedContext) -> Callable[[str], str]:
 
         agent_name: The name of the prior agent whose full output you want
         """
-        full = context.get(agent_name)
+        full = self._context.get(agent_name)
         if full is None:
             return f"No context found for agent '{agent_name}'."
         return full
 
-    return expand_context
 
-
-def _collect_agent_names(step: Agent | list[Agent | Flow]) -> list[str]:
+def _collect_agent_names(step: Agent | list[Agent | Flow]) -> tuple[str, ...]:
     """Collect agent names from a step for hook emission."""
     if isinstance(step, list):
         names: list[str] = []
@@ -70,8 +143,8 @@ def _collect_agent_names(step: Agent | list[Agent | Flow]) -> list[str]:
                 names.extend(a.name for a in item.agents)
             else:
                 names.append(item.name)
-        return names
-    return [step.name]
+        return tuple(names)
+    return (step.name,)
 
 
 def _terminal_names(step: Agent | list[Agent | Flow]) -> set[str]:
@@ -107,9 +180,14 @@ class Swarm:
         step_retries: int = 0,
         retry_delay: float = 1.0,
         retry_multiplier: float = 2.0,
+        retry_max_delay: float | None = None,
+        retry_jitter: bool = False,
+        history_file: str | None = None,
+        max_concurrency: int | None = None,
     ) -> None:
         self._steps = flow.steps
-        self._agents = {a.name: a for a in flow.agents}
+        # STEP_START payloads; steps are fixed, so names are collected once
+        self._step_agent_names = [_collect_agent_names(step) for step in self._steps]
         self._hooks = hooks
         self._context_mode = context_mode
         self._timeout = timeout
@@ -118,6 +196,18 @@ class Swarm:
         self._step_retries = step_retries
         self._retry_delay = retry_delay
         self._retry_multiplier = retry_multiplier
+        self._retry_max_delay = retry_max_delay
+        self._retry_jitter = retry_jitter
+        self._history_file = (
+            os.path.expanduser(history_file) if history_file is not None else None
+        )
+        # Parallel agents append from worker threads; the directory is
+        # created on the first append
+        self._history_lock = threading.Lock()
+        self._history_dir_ready = False
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self._max_concurrency = max_concurrency
 
     async def _with_retry(
         self,
@@ -128,7 +218,12 @@ class Swarm:
         """Run a coroutine with step-level retry on AgentError.
 
         *coro_factory* is called fresh on each attempt so the agent gets a
-        clean execution (new messages list, new tool state).
+        clean execution (new messages list, new tool state).  The backoff
+        delay grows by ``retry_multiplier`` per attempt, is capped at
+        ``retry_max_delay``, and with ``retry_jitter`` is drawn uniformly
+        from ``[0, delay]`` so parallel agents that fail together do not
+        retry in lockstep.  A ``Retry-After`` hint from the provider, when
+        present, is a lower bound on the delay.
         """
         last_error: AgentError | None = None
 
@@ -139,7 +234,14 @@ class Swarm:
                 last_error = e
                 if attempt < self._step_retries:
                     delay = self._retry_delay * (self._retry_multiplier**attempt)
-                    if hooks and hooks.is_active:
+                    if self._retry_max_delay is not None:
+                        delay = min(delay, self._retry_max_delay)
+                    if self._retry_jitter:
+                        delay = random.uniform(0.0, delay)
+                    retry_after = _retry_after(e)
+                    if retry_after is not None:
+                        delay = max(delay, retry_after)
+                    if hooks and hooks.is_subscribed(EventType.AGENT_RETRY):
                         await hooks.emit(
                             Event(
                                 EventType.AGENT_RETRY,
@@ -171,44 +273,43 @@ class Swarm:
         lightweight summaries and pull tools (``list_context``, ``get_context``,
         ``search_context``).
         """
-        has_context = bool(context.keys())
+        has_context = bool(context)
         if has_context:
             prev_names = prev_step_names or set()
-            entries = context.entries()
 
-            # Split: previous-step outputs get pushed, earlier ones stay as pull
-            prev_entries = [(n, s, f, c) for n, s, f, c in entries if n in prev_names]
-            earlier_entries = [
-                (n, s, f, c) for n, s, f, c in entries if n not in prev_names
-            ]
+            # Split: previous-step outputs get pushed, earlier ones stay as
+            # pull.  Only names and sizes are gathered here; full outputs
+            # are read from the context just for the entries being pushed.
+            rows = context.index()
+            prev_rows = [row for row in rows if row[0] in prev_names]
+            earlier_rows = [row for row in rows if row[0] not in prev_names]
 
-            # Budget check: if prev-step outputs exceed budget, demote to pull
-            if self._context_budget is not None and prev_entries:
-                total_prev_chars = sum(c for _, _, _, c in prev_entries)
-                if total_prev_chars > self._context_budget:
-                    earlier_entries = prev_entries + earlier_entries
-                    prev_entries = []
+            # Budget check: push as many prev-step outputs as fit, demote
+            # the rest to summaries + pull tools
+            if self._context_budget is not None and prev_rows:
+                prev_rows, demoted = _fit_to_budget(prev_rows, self._context_budget)
+                earlier_rows = demoted + earlier_rows
 
             hint_parts: list[str] = []
 
             # Push full output from immediately preceding agents
-            for name, _summary, full, _count in prev_entries:
-                hint_parts.append(f"## {name}\n{full}")
+            for name, _summary, _count in prev_rows:
+                hint_parts.append(f"## {name}\n{context.get(name)}")
 
             # Summaries + pull tools for earlier agents
-            if earlier_entries:
+            if earlier_rows:
                 hint_parts.append(
                     "\nEarlier agent outputs are also available. Use the "
                     "`list_context`, `get_context`, and `search_context` "
                     "tools to retrieve them as needed.\n"
                 )
-                for name, summary, _full, _count in earlier_entries:
+                for name, summary, _count in earlier_rows:
                     hint_parts.append(f"- **{name}**: {summary}")
 
             context_hint: str | None = "\n".join(hint_parts) if hint_parts else None
 
             # Only inject pull tools when there are earlier entries to pull from
-            extra_tools = make_context_tools(context) if earlier_entries else None
+            extra_tools = make_context_tools(context) if earlier_rows else None
         else:
             context_hint = None
             extra_tools = None
@@ -239,14 +340,16 @@ class Swarm:
         expand_tool: Callable[[str], str],
     ) -> AgentResult:
         """Run a single agent in push mode, handling expand tool and output parsing."""
-        # Budget check: if expanded outputs exceed budget, demote all to summaries
+        # Budget check: expand as many outputs as fit, summarize the rest
         if self._context_budget is not None and expand:
-            total_expand_chars = sum(len(context.get(name) or "") for name in expand)
-            if total_expand_chars > self._context_budget:
-                expand = set()
+            rows = [row for row in context.index() if row[0] in expand]
+            kept, _demoted = _fit_to_budget(rows, self._context_budget)
+            expand = {name for name, _summary, _count in kept}
 
-        context_keys = set(context.to_dict().keys())
-        summarized = context_keys - (expand or set())
+        # Offer expand_context only if some entry is shown as a summary
+        summarized = (
+            any(key not in expand for key in context) if expand else bool(context)
+        )
         extra_tools = [expand_tool] if summarized else None
 
         result = await agent.run(
@@ -265,6 +368,139 @@ class Swarm:
         context.set(result.agent_name, detail, summary=summary)
         return result
 
+    async def _run_agent(
+        self,
+        agent: Agent,
+        task: str,
+        context: SharedContext,
+        hooks: Hooks | None,
+        expand_tool: Callable[[str], str],
+        prev_step_names: set[str],
+    ) -> AgentResult:
+        """Run a single agent with step-level retry in the configured context mode."""
+        attempt: Callable[[], Awaitable[AgentResult]]
+        if self._context_mode == "pull":
+
+            def attempt() -> Awaitable[AgentResult]:
+                return self._run_agent_pull(
+                    agent, task, context, hooks, prev_step_names
+                )
+
+        else:
+            expand = prev_step_names or None
+
+            def attempt() -> Awaitable[AgentResult]:
+                return self._run_agent_push(
+                    agent, task, context, hooks, expand, expand_tool
+                )
+
+        result = await self._with_retry(
+            lambda: self._limited(attempt),
+            agent_name=agent.name,
+            hooks=hooks,
+        )
+        if self._history_file is not None:
+            await asyncio.to_thread(self._append_history, _run_id.get(), result)
+        return result
+
+    async def _limited(self, coro_factory: Callable[[], Awaitable[_T]]) -> _T:
+        """Await *coro_factory()* under the run's ``max_concurrency`` limit.
+
+        The slot is held for one attempt only, so an agent waiting out a
+        retry delay does not block others from running.
+        """
+        limit = _run_limit.get()
+        if limit is None:
+            return await coro_factory()
+        async with limit:
+            return await coro_factory()
+
+    def _append_history(self, run_id: str, result: AgentResult) -> None:
+        """Append *result* as one JSON line tagged with its run's *run_id*."""
+        assert self._history_file is not None
+        # Splice the run id into the object rather than re-encoding the result
+        line = f'{{"run_id":"{run_id}",{result.model_dump_json()[1:]}\n'
+        with self._history_lock:
+            if not self._history_dir_ready:
+                os.makedirs(os.path.dirname(self._history_file) or ".", exist_ok=True)
+                self._history_dir_ready = True
+            with open(self._history_file, "a", encoding="utf-8") as f:
+                f.write(line)
+
+    async def _run_branch(
+        self,
+        item: Agent | Flow,
+        task: str,
+        context: SharedContext,
+        hooks: Hooks | None,
+        expand_tool: Callable[[str], str],
+        prev_step_names: set[str],
+    ) -> tuple[list[AgentResult], set[str]]:
+        """Run one branch of a parallel group (an agent or a sub-flow)."""
+        if isinstance(item, Flow):
+            return await self._run_subflow(
+                item, task, context, hooks, expand_tool, prev_step_names
+            )
+        result = await self._run_agent(
+            item, task, context, hooks, expand_tool, prev_step_names
+        )
+        return [result], {result.agent_name}
+
+    async def _run_parallel(
+        self,
+        items: list[Agent | Flow],
+        task: str,
+        context: SharedContext,
+        hooks: Hooks | None,
+        expand_tool: Callable[[str], str],
+        prev_step_names: set[str],
+    ) -> tuple[list[AgentResult], set[str]]:
+        """Run a parallel group concurrently, returning results and terminal names.
+
+        Every branch is scheduled as a task before any of them is awaited, so
+        their LLM calls overlap and the step takes roughly as long as its
+        slowest branch.  Results are collected in branch order; if any branch
+        fails, the first failure is raised once all branches have settled.
+        """
+        tasks = [
+            asyncio.create_task(
+                self._run_branch(
+                    item, task, context, hooks, expand_tool, prev_step_names
+                )
+            )
+            for item in items
+        ]
+        gathered = await asyncio.gather(*tasks, return_exceptions=True)
+
+        results: list[AgentResult] = []
+        current_names: set[str] = set()
+        for g in gathered:
+            if isinstance(g, BaseException):
+                raise g
+            branch_results, branch_terminal = g
+            results.extend(branch_results)
+            current_names |= branch_terminal
+        return results, current_names
+
+    async def _run_step(
+        self,
+        step: Agent | list[Agent | Flow],
+        task: str,
+        context: SharedContext,
+        hooks: Hooks | None,
+        expand_tool: Callable[[str], str],
+        prev_step_names: set[str],
+    ) -> tuple[list[AgentResult], set[str]]:
+        """Run a single step, returning its results and terminal agent names."""
+        if isinstance(step, list):
+            return await self._run_parallel(
+                step, task, context, hooks, expand_tool, prev_step_names
+            )
+        result = await self._run_agent(
+            step, task, context, hooks, expand_tool, prev_step_names
+        )
+        return [result], {result.agent_name}
+
     async def _run_subflow(
         self,
         subflow: Flow,
@@ -279,100 +515,35 @@ class Swarm:
         sub_prev: set[str] = set(prev_step_names)
 
         for step in subflow.steps:
-            if self._context_mode == "pull":
-                if isinstance(step, list):
-                    coros = []
-                    for item in step:
-                        if isinstance(item, Flow):
-                            coros.append(
-                                self._run_subflow(
-                                    item, task, context, hooks, expand_tool, sub_prev
-                                )
-                            )
-                        else:
-                            coros.append(
-                                self._with_retry(
-                                    lambda a=item, p=sub_prev: self._run_agent_pull(
-                                        a, task, context, hooks, p
-                                    ),
-                                    agent_name=item.name,
-                                    hooks=hooks,
-                                )
-                            )
-                    gathered = await asyncio.gather(*coros)
-                    current_names: set[str] = set()
-                    for g in gathered:
-                        if isinstance(g, tuple):
-                            sub_results, sub_terminal = g
-                            results.extend(sub_results)
-                            current_names |= sub_terminal
-                        else:
-                            results.append(g)
-                            current_names.add(g.agent_name)
-                    sub_prev = current_names
-                else:
-                    result = await self._with_retry(
-                        lambda s=step, p=sub_prev: self._run_agent_pull(
-                            s, task, context, hooks, p
-                        ),
-                        agent_name=step.name,
-                        hooks=hooks,
-                    )
-                    results.append(result)
-                    sub_prev = {result.agent_name}
-            else:
-                expand = sub_prev or None
-                if isinstance(step, list):
-                    coros = []
-                    for item in step:
-                        if isinstance(item, Flow):
-                            coros.append(
-                                self._run_subflow(
-                                    item, task, context, hooks, expand_tool, sub_prev
-                                )
-                            )
-                        else:
-                            coros.append(
-                                self._with_retry(
-                                    lambda a=item, e=expand: self._run_agent_push(
-                                        a, task, context, hooks, e, expand_tool
-                                    ),
-                                    agent_name=item.name,
-                                    hooks=hooks,
-                                )
-                            )
-                    gathered = await asyncio.gather(*coros)
-                    current_names = set()
-                    for g in gathered:
-                        if isinstance(g, tuple):
-                            sub_results, sub_terminal = g
-                            results.extend(sub_results)
-                            current_names |= sub_terminal
-                        else:
-                            results.append(g)
-                            current_names.add(g.agent_name)
-                    sub_prev = current_names
-                else:
-                    result = await self._with_retry(
-                        lambda s=step, e=expand: self._run_agent_push(
-                            s, task, context, hooks, e, expand_tool
-                        ),
-                        agent_name=step.name,
-                        hooks=hooks,
-                    )
-                    results.append(result)
-                    sub_prev = {result.agent_name}
+            step_results, sub_prev = await self._run_step(
+                step, task, context, hooks, expand_tool, sub_prev
+            )
+            results.extend(step_results)
 
         return results, sub_prev
 
     async def run(self, task: str) -> SwarmResult:
         """Execute the swarm workflow on the given task."""
-        swarm_start = time.monotonic()
+        limit = (
+            asyncio.Semaphore(self._max_concurrency)
+            if self._max_concurrency is not None
+            else None
+        )
+        token = _run_limit.set(limit)
+        id_token = _run_id.set(uuid.uuid4().hex)
+        try:
+            return await self._run(task)
+        finally:
+            _run_id.reset(id_token)
+            _run_limit.reset(token)
+
+    async def _run(self, task: str) -> SwarmResult:
+        swarm_start = time.perf_counter_ns()
         context = SharedContext()
         history: list[AgentResult] = []
         hooks = self._hooks
 
-        if hooks and hooks.is_active:
+        if hooks and hooks.is_subscribed(EventType.SWARM_START):
             await hooks.emit(
                 Event(
                     EventType.SWARM_START,
@@ -381,139 +552,49 @@ class Swarm:
             )
 
         prev_step_names: set[str] = set()
-        expand_tool = _make_expand_tool(context)
+        expand_tool = _ExpandContextTool(context).expand_context
+
+        # Subscriptions are checked once per run rather than on every step
+        on_step_start = (
+            hooks if hooks and hooks.is_subscribed(EventType.STEP_START) else None
+        )
+        on_step_end = (
+            hooks if hooks and hooks.is_subscribed(EventType.STEP_END) else None
+        )
 
         step_history_start = 0
         for step_index, step in enumerate(self._steps):
             step_history_start = len(history)
-            if hooks and hooks.is_active:
-                agent_names = _collect_agent_names(step)
-                await hooks.emit(
+            if on_step_start is not None:
+                await on_step_start.emit(
                     Event(
                         EventType.STEP_START,
                         StepStartData(
                             step_index=step_index,
-                            agents=agent_names,
+                            # A fresh list, so handlers may keep or mutate it
+                            agents=list(self._step_agent_names[step_index]),
                             parallel=isinstance(step, list),
                         ),
                     )
                 )
 
-            if self._context_mode == "pull":
-                if isinstance(step, list):
-                    coros = []
-                    for item in step:
-                        if isinstance(item, Flow):
-                            coros.append(
-                                self._run_subflow(
-                                    item,
-                                    task,
-                                    context,
-                                    hooks,
-                                    expand_tool,
-                                    prev_step_names,
-                                )
-                            )
-                        else:
-                            coros.append(
-                                self._with_retry(
-                                    lambda a=item, p=prev_step_names: (
-                                        self._run_agent_pull(a, task, context, hooks, p)
-                                    ),
-                                    agent_name=item.name,
-                                    hooks=hooks,
-                                )
-                            )
-                    gathered = await asyncio.gather(*coros)
-
-                    current_step_names: set[str] = set()
-                    for g in gathered:
-                        if isinstance(g, tuple):
-                            sub_results, sub_terminal = g
-                            history.extend(sub_results)
-                            current_step_names |= sub_terminal
-                        else:
-                            history.append(g)
-                            current_step_names.add(g.agent_name)
-                    prev_step_names = current_step_names
-                else:
-                    result = await self._with_retry(
-                        lambda s=step, p=prev_step_names: self._run_agent_pull(
-                            s, task, context, hooks, p
-                        ),
-                        agent_name=step.name,
-                        hooks=hooks,
-                    )
-                    history.append(result)
-                    prev_step_names = {result.agent_name}
-            else:
-                # Push mode
-                expand = prev_step_names or None
-
-                if isinstance(step, list):
-                    coros = []
-                    for item in step:
-                        if isinstance(item, Flow):
-                            coros.append(
-                                self._run_subflow(
-                                    item,
-                                    task,
-                                    context,
-                                    hooks,
-                                    expand_tool,
-                                    prev_step_names,
-                                )
-                            )
-                        else:
-                            coros.append(
-                                self._with_retry(
-                                    lambda a=item, e=expand: self._run_agent_push(
-                                        a, task, context, hooks, e, expand_tool
-                                    ),
-                                    agent_name=item.name,
-                                    hooks=hooks,
-                                )
-                            )
-                    gathered = await asyncio.gather(*coros)
-
-                    current_step_names_push: set[str] = set()
-                    for g in gathered:
-                        if isinstance(g, tuple):
-                            sub_results, sub_terminal = g
-                            history.extend(sub_results)
-                            current_step_names_push |= sub_terminal
-                        else:
-                            history.append(g)
-                            current_step_names_push.add(g.agent_name)
-                    prev_step_names = current_step_names_push
-                else:
-                    result = await self._with_retry(
-                        lambda s=step, e=expand: self._run_agent_push(
-                            s, task, context, hooks, e, expand_tool
-                        ),
-                        agent_name=step.name,
-                        hooks=hooks,
-                    )
-                    history.append(result)
-                    prev_step_names = {result.agent_name}
+            step_results, prev_step_names = await self._run_step(
+                step, task, context, hooks, expand_tool, prev_step_names
+            )
+            history.extend(step_results)
 
-            if hooks and hooks.is_active:
-                await hooks.emit(
+            if on_step_end is not None:
+                await on_step_end.emit(
                     Event(
                         EventType.STEP_END,
                         StepEndData(step_index=step_index),
                     )
                 )
 
-        swarm_duration = round(time.monotonic() - swarm_start, 3)
+        swarm_duration = (time.perf_counter_ns() - swarm_start) / 1e9
 
-        total_usage = TokenUsage()
-        total_cost = 0.0
-        for agent_result in history:
-            total_usage.prompt_tokens += agent_result.token_usage.prompt_tokens
-            total_usage.completion_tokens += agent_result.token_usage.completion_tokens
-            total_usage.total_tokens += agent_result.token_usage.total_tokens
-            total_cost += agent_result.cost
+        total_usage = TokenUsage.total(r.token_usage for r in history)
+        total_cost = sum((r.cost for r in history), 0.0)
 
         # When the final step is a parallel group, combine all final agents' outputs.
         # Only consider results from the final step to avoid duplicating outputs
@@ -528,7 +609,8 @@ class Swarm:
         else:
             output = history[-1].output
 
-        swarm_result = SwarmResult(
+        # Inputs are built by this run; skip re-validating the whole history
+        swarm_result = SwarmResult.model_construct(
             output=output,
             context=context.to_dict(),
             history=history,
@@ -537,7 +619,7 @@ class Swarm:
             total_cost=total_cost,
         )
 
-        if hooks and hooks.is_active:
+        if hooks and hooks.is_subscribed(EventType.SWARM_END):
             await hooks.emit(
                 Event(
                     EventType.SWARM_END,
@@ -1,7 +1,177 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import functools
+import hashlib
+import inspect
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, TypeVar
 
-def search_web(query: str, max_results: int = 5) -> str:
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+class _ToolCache:
+    """Two-tier result cache: an in-process LRU backed by an optional sqlite file."""
+
+    def __init__(self, ttl: float | None, maxsize: int, store: str | None) -> None:
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._hot: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        # Sync tools run in worker threads, so the LRU may be hit concurrently
+        self._lock = threading.Lock()
+        self._store = os.path.expanduser(store) if store is not None else None
+        if self._store is not None:
+            os.makedirs(os.path.dirname(self._store) or ".", exist_ok=True)
+            with contextlib.closing(self._connect()) as conn, conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS cache"
+                    "(k TEXT PRIMARY KEY, ts INTEGER, v BLOB)"
+                )
+
+    def _connect(self) -> sqlite3.Connection:
+        assert self._store is not None
+        return sqlite3.connect(self._store)
+
+    def _fresh(self, ts: float) -> bool:
+        return self._ttl is None or time.time() - ts < self._ttl
+
+    def get(self, key: str) -> str | None:
+        hit = self._get_hot(key)
+        if hit is not None or self._store is None:
+            return hit
+        return self._load(key)
+
+    def put(self, key: str, value: str) -> None:
+        ts = time.time()
+        self._remember(key, ts, value)
+        if self._store is not None:
+            self._persist(key, ts, value)
+
+    async def aget(self, key: str) -> str | None:
+        """Like :meth:`get`, but reads the sqlite tier in a worker thread."""
+        hit = self._get_hot(key)
+        if hit is not None or self._store is None:
+            return hit
+        return await asyncio.to_thread(self._load, key)
+
+    async def aput(self, key: str, value: str) -> None:
+        """Like :meth:`put`, but writes the sqlite tier in a worker thread."""
+        ts = time.time()
+        self._remember(key, ts, value)
+        if self._store is not None:
+            await asyncio.to_thread(self._persist, key, ts, value)
+
+    def _get_hot(self, key: str) -> str | None:
+        with self._lock:
+            hit = self._hot.get(key)
+            if hit is not None:
+                if self._fresh(hit[0]):
+                    self._hot.move_to_end(key)
+                    return hit[1]
+                del self._hot[key]
+        return None
+
+    def _load(self, key: str) -> str | None:
+        with contextlib.closing(self._connect()) as conn:
+            row = conn.execute("SELECT ts, v FROM cache WHERE k = ?", (key,)).fetchone()
+        if row is None or not self._fresh(row[0]):
+            return None
+        self._remember(key, row[0], row[1])
+        return row[1]
+
+    def _persist(self, key: str, ts: float, value: str) -> None:
+        with contextlib.closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (k, ts, v) VALUES (?, ?, ?)",
+                (key, int(ts), value),
+            )
+
+    def _remember(self, key: str, ts: float, value: str) -> None:
+        with self._lock:
+            self._hot[key] = (ts, value)
+            self._hot.move_to_end(key)
+            if len(self._hot) > self._maxsize:
+                self._hot.popitem(last=False)
+
+
+def cached_tool(
+    *,
+    ttl: float | None = None,
+    maxsize: int = 512,
+    store: str | None = None,
+    key: Callable[[dict[str, Any]], str] | None = None,
+) -> Callable[[_F], _F]:
+    """Cache a string-returning tool's results by its arguments.
+
+    Results are kept in an in-process LRU of *maxsize* entries and, when
+    *store* is a file path, persisted to a sqlite database so they survive
+    across runs.  Entries older than *ttl* seconds are ignored.  *key*
+    maps the bound arguments to a cache key; by default all arguments are
+    used verbatim.  Results starting with ``"Error:"`` are never cached.
+
+    Works with both sync and async tools, and preserves the wrapped
+    function's name, signature, and docstring for tool-schema generation::
+
+        search = cached_tool(ttl=86400, store="~/.cache/swarmcore/search.sqlite")(
+            my_search
+        )
+    """
+
+    def decorator(func: _F) -> _F:
+        cache = _ToolCache(ttl, maxsize, store)
+        sig = inspect.signature(func)
+        name = f"{func.__module__}.{func.__qualname__}"
+
+        def make_key(args: tuple[Any, ...], kwargs: dict[str, Any]) -> str:
+            bound = sig.bind(*args, **kwargs)
+            bound.apply_defaults()
+            raw = (
+                key(bound.arguments)
+                if key is not None
+                else json.dumps(bound.arguments, sort_keys=True, default=str)
+            )
+            return hashlib.sha1(f"{name}\0{raw}".encode()).hexdigest()
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                k = make_key(args, kwargs)
+                cached = await cache.aget(k)
+                if cached is not None:
+                    return cached
+                result = await func(*args, **kwargs)
+                if isinstance(result, str) and not result.startswith("Error:"):
+                    await cache.aput(k, result)
+                return result
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            k = make_key(args, kwargs)
+            cached = cache.get(k)
+            if cached is not None:
+                return cached
+            result = func(*args, **kwargs)
+            if isinstance(result, str) and not result.startswith("Error:"):
+                cache.put(k, result)
+            return result
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+async def search_web(query: str, max_results: int = 5) -> str:
     """Search the web using DuckDuckGo and return formatted results.
 
     query: The search query string
@@ -15,7 +185,11 @@ def search_web(query: str, max_results: int = 5) -> str:
         except ImportError:
             return "Error: ddgs is not installed. Install it with: pip install ddgs"
 
-    results = DDGS().text(query, max_results=max_results)
+    # DDGS is blocking; run it in a worker thread so other agents in a
+    # parallel step keep making progress while this search is in flight.
+    results = await asyncio.to_thread(
+        lambda: DDGS().text(query, max_results=max_results)
+    )
 
     if not results:
         return "No results found."
@@ -11,12 +11,16 @@ def make_mock_response(
     tool_calls: list[Any] | None = None,
     prompt_tokens: int = 10,
     completion_tokens: int = 20,
+    cache_read_tokens: int = 0,
+    cache_creation_tokens: int = 0,
 ) -> MagicMock:
     """Create a mock litellm ModelResponse."""
     usage = MagicMock()
     usage.prompt_tokens = prompt_tokens
     usage.completion_tokens = completion_tokens
     usage.total_tokens = prompt_tokens + completion_tokens
+    usage.prompt_tokens_details.cached_tokens = cache_read_tokens
+    usage.cache_creation_input_tokens = cache_creation_tokens
 
     message = MagicMock()
     message.content = content
@@ -1,12 +1,27 @@
 from __future__ import annotations
 
+import asyncio
+import functools
+import json
+import threading
+import time
+from collections.abc import Awaitable
+from typing import Any, AnyStr
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from swarmcore.agent import Agent, _function_to_tool_schema
+from swarmcore.agent import (
+    Agent,
+    _function_to_tool_schema,
+    _supports_cache_control,
+    _tool_kind,
+    _ToolKind,
+    current_agent,
+)
 from swarmcore.context import SharedContext
 from swarmcore.exceptions import AgentError
+from swarmcore.hooks import EventType, Hooks
 from tests.conftest import make_mock_response
 
 
@@ -43,6 +58,14 @@ async def test_agent_basic_run(mock_llm: AsyncMock):
     assert messages[1]["content"] == "Hello"
 
 
+async def test_agent_name_passed_as_litellm_metadata(mock_llm: AsyncMock):
+    agent = Agent(name="test", instructions="Be helpful.")
+
+    await agent.run("Hello", SharedContext())
+
+    assert mock_llm.call_args.kwargs["metadata"] == {"agent_name": "test"}
+
+
 async def test_agent_context_injection(mock_llm: AsyncMock):
     agent = Agent(name="writer", instructions="Write a report.")
     ctx = SharedContext()
@@ -199,6 +222,47 @@ def test_function_to_tool_schema():
     assert "max_results" not in params["required"]
 
 
+def test_function_to_tool_schema_param_descriptions():
+    def lookup(city: str, units: str = "metric") -> str:
+        """Look up the weather.
+
+        city: City name
+        units : Unit system
+        """
+        return ""
+
+    props = _function_to_tool_schema(lookup)["function"]["parameters"]["properties"]
+    assert props["city"]["description"] == "City name"
+    assert props["units"]["description"] == "Unit system"
+
+
+def test_function_to_tool_schema_cached_per_function():
+    def ping() -> str:
+        """Ping."""
+        return "pong"
+
+    def other() -> str:
+        """Other."""
+        return ""
+
+    assert _function_to_tool_schema(ping) is _function_to_tool_schema(ping)
+    assert _function_to_tool_schema(other) is not _function_to_tool_schema(ping)
+
+
+def test_function_to_tool_schema_cached_for_bound_methods():
+    class Store:
+        def lookup(self, key: str) -> str:
+            """Look up a key.
+
+            key: The key to find
+            """
+            return key
+
+    schema = _function_to_tool_schema(Store().lookup)
+    assert _function_to_tool_schema(Store().lookup) is schema
+    assert list(schema["function"]["parameters"]["properties"]) == ["key"]
+
+
 # --- Tiered context tests ---
 
 
@@ -225,6 +289,34 @@ async def test_structured_output_not_injected_by_default(mock_llm: AsyncMock):
     assert "<summary>" not in system_msg
 
 
+async def test_static_prompt_sections_precede_context(mock_llm: AsyncMock):
+    """Instructions and output format form a stable prefix ahead of the context."""
+    agent = Agent(name="writer", instructions="Write a report.")
+    ctx = SharedContext()
+    ctx.set("researcher", "AI is trending in 2025.")
+
+    await agent.run("Write about AI", ctx, structured_output=True)
+
+    system_msg = mock_llm.call_args.kwargs["messages"][0]["content"]
+    assert system_msg.startswith("Write a report.")
+    assert system_msg.index("# Output format") < system_msg.index(
+        "# Context from prior agents"
+    )
+
+
+async def test_cache_token_usage_tracked(mock_llm: AsyncMock):
+    mock_llm.return_value = make_mock_response(
+        prompt_tokens=100, cache_read_tokens=80, cache_creation_tokens=15
+    )
+    agent = Agent(name="test", instructions="Be helpful.")
+
+    result = await agent.run("Hello", SharedContext())
+
+    assert result.token_usage.cache_read_tokens == 80
+    assert result.token_usage.cache_creation_tokens == 15
+    assert result.llm_calls[0].token_usage.cache_read_tokens == 80
+
+
 async def test_expand_param_forwarded_to_context(mock_llm: AsyncMock):
     agent = Agent(name="writer", instructions="Write.")
     ctx = SharedContext()
@@ -384,3 +476,523 @@ async def test_agent_async_tool_execution_error(mock_llm: AsyncMock):
         "Error: tool 'async_failing' failed: async failure"
         in result.tool_calls[0].result
     )
+
+
+async def test_current_agent_visible_to_tools(mock_llm: AsyncMock):
+    seen: list[str | None] = []
+
+    def whoami() -> str:
+        """Report the running agent."""
+        seen.append(current_agent.get())
+        return "ok"
+
+    tool_call = MagicMock()
+    tool_call.id = "call_1"
+    tool_call.function.name = "whoami"
+    tool_call.function.arguments = "{}"
+
+    mock_llm.side_effect = [
+        make_mock_response(content=None, tool_calls=[tool_call]),
+        make_mock_response(content="done"),
+    ]
+
+    agent = Agent(name="detective", instructions="Investigate.", tools=[whoami])
+    await agent.run("Who am I?", SharedContext())
+
+    assert seen == ["detective"]
+    assert current_agent.get() is None
+
+
+def _tool_call(call_id: str, name: str, arguments: str) -> MagicMock:
+    tool_call = MagicMock()
+    tool_call.id = call_id
+    tool_call.function.name = name
+    tool_call.function.arguments = arguments
+    return tool_call
+
+
+async def test_tool_calls_in_one_turn_run_concurrently(mock_llm: AsyncMock):
+    """Tool calls from one assistant message overlap; results keep request order."""
+    in_flight = 0
+    peak = 0
+
+    async def slow_lookup(key: str) -> str:
+        """Look up a key."""
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01 if key == "a" else 0.0)
+        in_flight -= 1
+        return f"value {key}"
+
+    def blocking_lookup(key: str) -> str:
+        """Look up a key, blocking."""
+        time.sleep(0.01)
+        return f"blocking {key}"
+
+    mock_llm.side_effect = [
+        make_mock_response(
+            content=None,
+            tool_calls=[
+                _tool_call("c1", "slow_lookup", '{"key": "a"}'),
+                _tool_call("c2", "slow_lookup", '{"key": "b"}'),
+                _tool_call("c3", "blocking_lookup", '{"key": "c"}'),
+            ],
+        ),
+        make_mock_response(content="Done."),
+    ]
+
+    agent = Agent(
+        name="lookup", instructions="Look up.", tools=[slow_lookup, blocking_lookup]
+    )
+    result = await agent.run("Go", SharedContext())
+
+    assert peak == 2
+    assert [tc.result for tc in result.tool_calls] == [
+        "value a",
+        "value b",
+        "blocking c",
+    ]
+    tool_messages = mock_llm.call_args_list[1].kwargs["messages"][-3:]
+    assert [m["tool_call_id"] for m in tool_messages] == ["c1", "c2", "c3"]
+
+
+async def test_dict_tool_result_sent_as_json(mock_llm: AsyncMock):
+    def stats(ticker: str) -> dict[str, object]:
+        """Fetch stats."""
+        return {"ticker": ticker, "price": 1.5, "tags": ["a"]}
+
+    mock_llm.side_effect = [
+        make_mock_response(
+            content=None, tool_calls=[_tool_call("c1", "stats", '{"ticker": "X"}')]
+        ),
+        make_mock_response(content="Done."),
+    ]
+
+    agent = Agent(name="quant", instructions="Analyze.", tools=[stats])
+    await agent.run("Go", SharedContext())
+
+    content = mock_llm.call_args_list[1].kwargs["messages"][-1]["content"]
+    assert json.loads(content) == {"ticker": "X", "price": 1.5, "tags": ["a"]}
+
+
+async def test_sync_extra_tool_shadowing_async_tool_runs_in_thread(
+    mock_llm: AsyncMock,
+):
+    """Tools are classified at registration; an extra tool replaces the kind too."""
+
+    async def lookup(key: str) -> str:
+        """Look up a key."""
+        return "async"
+
+    def sync_lookup(key: str) -> str:
+        """Look up a key."""
+        return threading.current_thread().name
+
+    sync_lookup.__name__ = "lookup"
+
+    mock_llm.side_effect = [
+        make_mock_response(
+            content=None, tool_calls=[_tool_call("c1", "lookup", '{"key": "k"}')]
+        ),
+        make_mock_response(content="Done."),
+    ]
+
+    agent = Agent(name="test", instructions="Look.", tools=[lookup])
+    await agent.run("Go", SharedContext(), extra_tools=[sync_lookup])
+
+    content = mock_llm.call_args_list[1].kwargs["messages"][-1]["content"]
+    assert content != threading.current_thread().name
+    assert agent._tool_kinds["lookup"] is _ToolKind.COROUTINE
+
+
+def test_tool_kind_classification():
+    def plain(x: str) -> str:
+        return x
+
+    async def coro(x: str) -> str:
+        return x
+
+    def deferred(x: str) -> Awaitable[str]:
+        return coro(x)
+
+    class AsyncCallable:
+        async def __call__(self, x: str) -> str:
+            return x
+
+    assert _tool_kind(plain) is _ToolKind.SYNC
+    assert _tool_kind(coro) is _ToolKind.COROUTINE
+    assert _tool_kind(AsyncCallable()) is _ToolKind.COROUTINE
+    assert _tool_kind(deferred) is _ToolKind.MAYBE_AWAITABLE
+    assert _tool_kind(functools.partial(plain)) is _ToolKind.MAYBE_AWAITABLE
+    assert _tool_kind(lambda x: coro(x)) is _ToolKind.MAYBE_AWAITABLE
+
+
+class CoroutineReport(str):
+    """A plain ``str`` whose name merely mentions coroutines."""
+
+
+def test_tool_kind_resolves_return_annotations():
+    def echo(x: AnyStr) -> AnyStr:
+        return x
+
+    def report() -> CoroutineReport:
+        return CoroutineReport("done")
+
+    def optional() -> str | None:
+        return None
+
+    def anything() -> Any:
+        return None
+
+    def either() -> str | Awaitable[str]:
+        return ""
+
+    def unresolvable() -> Missing:  # noqa: F821
+        return None
+
+    assert _tool_kind(echo) is _ToolKind.SYNC
+    assert _tool_kind(report) is _ToolKind.SYNC
+    assert _tool_kind(optional) is _ToolKind.SYNC
+    assert _tool_kind(anything) is _ToolKind.MAYBE_AWAITABLE
+    assert _tool_kind(either) is _ToolKind.MAYBE_AWAITABLE
+    assert _tool_kind(unresolvable) is _ToolKind.MAYBE_AWAITABLE
+
+
+async def test_unannotated_tool_returning_coroutine_is_awaited(mock_llm: AsyncMock):
+    async def fetch(key: str) -> str:
+        return f"value-{key}"
+
+    def lookup(key):
+        """Look up a key."""
+        return fetch(key)
+
+    mock_llm.side_effect = [
+        make_mock_response(
+            content=None, tool_calls=[_tool_call("c1", "lookup", '{"key": "k"}')]
+        ),
+        make_mock_response(content="Done."),
+    ]
+
+    agent = Agent(name="test", instructions="Look.", tools=[lookup])
+    result = await agent.run("Go", SharedContext())
+
+    assert agent._tool_kinds["lookup"] is _ToolKind.MAYBE_AWAITABLE
+    assert result.tool_calls[0].result == "value-k"
+
+
+async def test_response_cache_reuses_output_for_identical_runs(mock_llm: AsyncMock):
+    agent = Agent(name="test", instructions="Be helpful.", cache_size=8)
+    ctx = SharedContext()
+
+    first = await agent.run("Hello", ctx)
+    second = await agent.run("Hello", ctx)
+    third = await agent.run("Goodbye", ctx)
+
+    assert mock_llm.call_count == 2
+    assert not first.cached
+    assert second.cached
+    assert second.output == first.output
+    assert second.llm_call_count == 0
+    assert second.token_usage.total_tokens == 0
+    assert not third.cached
+
+
+async def test_response_cache_off_by_default_and_bypassed_with_tools(
+    mock_llm: AsyncMock,
+):
+    def lookup(key: str) -> str:
+        """Look up a key."""
+        return key
+
+    plain = Agent(name="plain", instructions="Be helpful.")
+    tooled = Agent(
+        name="tooled", instructions="Be helpful.", tools=[lookup], cache_size=8
+    )
+
+    for agent in (plain, tooled):
+        await agent.run("Hello", SharedContext())
+        result = await agent.run("Hello", SharedContext())
+        assert not result.cached
+
+    assert mock_llm.call_count == 4
+
+
+async def test_response_cache_evicts_least_recent(mock_llm: AsyncMock):
+    agent = Agent(name="test", instructions="Be helpful.", cache_size=1)
+    ctx = SharedContext()
+
+    await agent.run("A", ctx)
+    await agent.run("B", ctx)
+    result = await agent.run("A", ctx)
+
+    assert not result.cached
+    assert mock_llm.call_count == 3
+
+
+def _stream_chunks(*texts: str) -> list[Any]:
+    from litellm.types.utils import Delta, ModelResponseStream, StreamingChoices
+
+    chunks = [
+        ModelResponseStream(
+            id="s", model="gpt-4o", choices=[StreamingChoices(delta=Delta(content=t))]
+        )
+        for t in texts
+    ]
+    chunks.append(
+        ModelResponseStream(
+            id="s",
+            model="gpt-4o",
+            choices=[StreamingChoices(delta=Delta(content=None), finish_reason="stop")],
+        )
+    )
+    return chunks
+
+
+async def test_stream_emits_tokens_and_assembles_output(mock_llm: AsyncMock):
+    async def stream(**kwargs):
+        assert kwargs["stream"] is True
+        for chunk in _stream_chunks("Hel", "lo"):
+            yield chunk
+
+    mock_llm.side_effect = lambda **kwargs: stream(**kwargs)
+    tokens: list[str] = []
+    hooks = Hooks()
+    hooks.on(EventType.LLM_TOKEN, lambda e: tokens.append(e.data.text))
+
+    agent = Agent(name="test", instructions="Be helpful.", stream=True)
+    result = await agent.run("Hello", SharedContext(), hooks=hooks)
+
+    assert tokens == ["Hel", "lo"]
+    assert result.output == "Hello"
+    assert result.llm_calls[0].finish_reason == "stop"
+
+
+async def test_stream_starts_completed_tool_calls_before_stream_ends(
+    mock_llm: AsyncMock,
+):
+    from litellm.types.utils import Delta, ModelResponseStream, StreamingChoices
+
+    first_started = asyncio.Event()
+
+    async def lookup(key: str) -> str:
+        """Look up a key."""
+        if key == "a":
+            first_started.set()
+        return key.upper()
+
+    def tool_chunk(index: int, call_id: str | None, arguments: str) -> Any:
+        function = {"arguments": arguments}
+        if call_id:
+            function["name"] = "lookup"
+        delta = Delta(
+            tool_calls=[
+                {
+                    "index": index,
+                    "id": call_id,
+                    "type": "function",
+                    "function": function,
+                }
+            ]
+        )
+        return ModelResponseStream(
+            id="s", model="gpt-4o", choices=[StreamingChoices(delta=delta)]
+        )
+
+    async def tool_stream(**kwargs):
+        yield tool_chunk(0, "c1", '{"key": ')
+        yield tool_chunk(0, None, '"a"}')
+        yield tool_chunk(1, "c2", '{"key": "b"}')
+        # Only reachable once the first call was dispatched mid-stream
+        await asyncio.wait_for(first_started.wait(), timeout=1)
+        yield ModelResponseStream(
+            id="s",
+            model="gpt-4o",
+            choices=[StreamingChoices(delta=Delta(), finish_reason="tool_calls")],
+        )
+
+    async def final_stream(**kwargs):
+        for chunk in _stream_chunks("Done."):
+            yield chunk
+
+    streams = iter([tool_stream, final_stream])
+    mock_llm.side_effect = lambda **kwargs: next(streams)(**kwargs)
+
+    order: list[str] = []
+    hooks = Hooks()
+    for event_type in (
+        EventType.LLM_CALL_END,
+        EventType.TOOL_CALL_START,
+        EventType.TOOL_CALL_END,
+    ):
+        hooks.on(event_type, lambda e: order.append(str(e.type)))
+
+    agent = Agent(name="test", instructions="Look.", tools=[lookup], stream=True)
+    result = await agent.run("Go", SharedContext(), hooks=hooks)
+
+    assert result.output == "Done."
+    assert result.input_task == "Go"
+    assert [r.result for r in result.tool_calls] == ["A", "B"]
+    # Early-started tools still report after their turn's LLM_CALL_END
+    assert order[0] == "llm_call_end"
+    assert order.count("tool_call_start") == order.count("tool_call_end") == 2
+    assert order[-1] == "llm_call_end"
+    tool_messages = mock_llm.call_args_list[1].kwargs["messages"][-2:]
+    assert [(m["tool_call_id"], m["content"]) for m in tool_messages] == [
+        ("c1", "A"),
+        ("c2", "B"),
+    ]
+
+
+async def test_tool_schemas_marked_for_caching_on_anthropic(mock_llm: AsyncMock):
+    def lookup(key: str) -> str:
+        """Look up a key."""
+        return key
+
+    def fetch(url: str) -> str:
+        """Fetch a URL."""
+        return url
+
+    claude = Agent(name="c", instructions="Go.", tools=[lookup, fetch])
+    gpt = Agent(name="g", instructions="Go.", model="openai/gpt-4o", tools=[lookup])
+
+    await claude.run("Go", SharedContext())
+    await gpt.run("Go", SharedContext())
+
+    claude_tools = mock_llm.call_args_list[0].kwargs["tools"]
+    assert "cache_control" not in claude_tools[0]
+    assert claude_tools[-1]["cache_control"] == {"type": "ephemeral"}
+    gpt_tools = mock_llm.call_args_list[1].kwargs["tools"]
+    assert "cache_control" not in gpt_tools[0]
+    # The shared, cached schema itself is left untouched
+    assert "cache_control" not in _function_to_tool_schema(fetch)
+
+
+def test_cache_control_unknown_provider_is_unsupported():
+    assert _supports_cache_control("not-a-provider/some-model") is False
+    assert _supports_cache_control("anthropic/claude-3-5-sonnet-latest") is True
+
+
+async def test_run_batch_packs_tasks_and_splits_responses(mock_llm: AsyncMock):
+    mock_llm.side_effect = [
+        make_mock_response(
+            content='<response id="1">one</response>\n<response id="2">two</response>'
+        ),
+        make_mock_response(content="three"),
+    ]
+
+    agent = Agent(name="classifier", instructions="Classify.")
+    results = await agent.run_batch(
+        ["first", "second", "third"], SharedContext(), batch_size=2
+    )
+
+    assert [r.output for r in results] == ["one", "two", "three"]
+    assert [r.input_task for r in results] == ["first", "second", "third"]
+    assert mock_llm.call_count == 2
+    packed = mock_llm.call_args_list[0].kwargs["messages"][-1]["content"]
+    assert "### Task 1\nfirst" in packed
+    assert "### Task 2\nsecond" in packed
+    # The shared call's usage is reported once
+    assert [r.llm_call_count for r in results] == [1, 0, 1]
+    assert sum(r.token_usage.total_tokens for r in results) == 60
+
+
+async def test_run_batch_reruns_tasks_missing_from_batch_output(
+    mock_llm: AsyncMock,
+):
+    mock_llm.side_effect = [
+        make_mock_response(content='<response id="2">two</response>'),
+        make_mock_response(content="one"),
+    ]
+
+    agent = Agent(name="classifier", instructions="Classify.")
+    results = await agent.run_batch(["first", "second"], SharedContext())
+
+    assert [r.output for r in results] == ["one", "two"]
+    assert mock_llm.call_args_list[1].kwargs["messages"][-1]["content"] == "first"
+    assert results[1].llm_call_count == 1
+
+
+async def test_run_batch_keeps_batch_usage_when_no_answer_parses(
+    mock_llm: AsyncMock,
+):
+    mock_llm.side_effect = [
+        make_mock_response(content="I ignored the format."),
+        make_mock_response(content="one"),
+        make_mock_response(content="two"),
+    ]
+
+    agent = Agent(name="classifier", instructions="Classify.")
+    results = await agent.run_batch(["first", "second"], SharedContext())
+
+    assert [r.output for r in results] == ["one", "two"]
+    assert [r.llm_call_count for r in results] == [2, 1]
+    assert sum(r.token_usage.total_tokens for r in results) == 90
+
+
+async def test_run_batch_reruns_missing_tasks_concurrently(mock_llm: AsyncMock):
+    in_flight = peak = 0
+
+    async def respond(**kwargs: Any):
+        nonlocal in_flight, peak
+        content = kwargs["messages"][-1]["content"]
+        if "### Task" in content:
+            return make_mock_response(content='<response id="2">two</response>')
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return make_mock_response(content=content.upper())
+
+    mock_llm.side_effect = respond
+
+    agent = Agent(name="classifier", instructions="Classify.")
+    results = await agent.run_batch(["first", "second", "third"], SharedContext())
+
+    assert [r.output for r in results] == ["FIRST", "two", "THIRD"]
+    assert peak == 2
+
+
+async def test_identical_tool_arguments_decoded_once_per_run(
+    mock_llm: AsyncMock, monkeypatch: pytest.MonkeyPatch
+):
+    import swarmcore.agent as agent_module
+
+    decoded: list[str] = []
+    real_loads = agent_module._loads
+
+    def counting_loads(data: str) -> Any:
+        decoded.append(data)
+        return real_loads(data)
+
+    monkeypatch.setattr(agent_module, "_loads", counting_loads)
+
+    def lookup(key: str) -> str:
+        """Look up a key."""
+        return key
+
+    args = '{"key": "k"}'
+    mock_llm.side_effect = [
+        make_mock_response(content=None, tool_calls=[_tool_call("c1", "lookup", args)]),
+        make_mock_response(content=None, tool_calls=[_tool_call("c2", "lookup", args)]),
+        make_mock_response(content="Done."),
+    ]
+
+    agent = Agent(name="test", instructions="Look.", tools=[lookup])
+    result = await agent.run("Go", SharedContext())
+
+    assert result.tool_call_count == 2
+    assert decoded == [args]
+
+
+async def test_system_message_marked_for_caching_on_anthropic(mock_llm: AsyncMock):
+    claude = Agent(name="c", instructions="Go.")
+    gpt = Agent(name="g", instructions="Go.", model="openai/gpt-4o")
+
+    await claude.run("Go", SharedContext())
+    await gpt.run("Go", SharedContext())
+
+    claude_system = mock_llm.call_args_list[0].kwargs["messages"][0]
+    assert claude_system["content"] == "Go."
+    assert claude_system["cache_control"] == {"type": "ephemeral"}
+    assert "cache_control" not in mock_llm.call_args_list[1].kwargs["messages"][0]
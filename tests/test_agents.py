@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import subprocess
+import sys
+
+import pytest
+
 from swarmcore.agent import Agent
 from swarmcore.agents import analyst, editor, researcher, summarizer, writer
 from swarmcore.flow import Flow
@@ -184,3 +189,19 @@ class TestExports:
 
         for name in ["researcher", "analyst", "writer", "editor", "summarizer"]:
             assert name in swarmcore.__all__
+
+    def test_all_names_resolve(self) -> None:
+        import swarmcore
+
+        for name in swarmcore.__all__:
+            assert getattr(swarmcore, name) is not None
+        with pytest.raises(AttributeError):
+            swarmcore.does_not_exist  # noqa: B018
+
+    def test_import_does_not_load_litellm(self) -> None:
+        code = (
+            "import sys, swarmcore; "
+            "swarmcore.Flow; "
+            "assert 'litellm' not in sys.modules, 'litellm imported eagerly'"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
@@ -74,6 +74,14 @@ def test_reporter_handles_all_events():
 # -- Color disable ----------------------------------------------------
 
 
+def test_silent_events_print_nothing():
+    """SWARM_START and STEP_END have no console output."""
+    reporter, buf = _make_reporter()
+    reporter(Event(EventType.SWARM_START, {"task": "t", "step_count": 1}))
+    reporter(Event(EventType.STEP_END, {"step_index": 0}))
+    assert buf.getvalue() == ""
+
+
 def test_color_disable():
     """With color=False, output contains no ANSI escape sequences."""
     reporter, buf = _make_reporter(color=False)
@@ -94,8 +102,36 @@ def test_color_disable():
     assert "\033[" not in output
 
 
+def test_color_auto_disabled_for_non_tty():
+    """By default, color is off when the output stream is not a terminal."""
+    buf = io.StringIO()
+    reporter = ConsoleReporter(file=buf)
+
+    reporter(Event(EventType.AGENT_START, {"agent": "a", "task": "t"}))
+
+    assert "\033[" not in buf.getvalue()
+
+
+def test_color_auto_respects_no_color(monkeypatch):
+    """``NO_COLOR`` disables color even on a terminal."""
+
+    class _Tty(io.StringIO):
+        def isatty(self) -> bool:
+            return True
+
+    buf = _Tty()
+    monkeypatch.setenv("NO_COLOR", "1")
+    ConsoleReporter(file=buf)(Event(EventType.AGENT_START, {"agent": "a"}))
+    assert "\033[" not in buf.getvalue()
+
+    buf = _Tty()
+    monkeypatch.delenv("NO_COLOR")
+    ConsoleReporter(file=buf)(Event(EventType.AGENT_START, {"agent": "a"}))
+    assert "\033[" in buf.getvalue()
+
+
 def test_color_enabled():
-    """With color=True (default), output contains ANSI escape sequences."""
+    """With color=True, output contains ANSI escape sequences."""
     reporter, buf = _make_reporter(color=True)
 
     reporter(Event(EventType.AGENT_END, {"agent": "a", "duration_seconds": 1.0}))
@@ -1,4 +1,4 @@
-from swarmcore.context import SharedContext
+from swarmcore.context import SharedContext, _compile_search
 
 
 def test_set_and_get():
@@ -197,3 +197,85 @@ def test_entries_returns_tuples():
     assert summary2 == "Full B"
     assert full2 == "Full B"
     assert count2 == len("Full B")
+
+
+def test_index_omits_full_output():
+    ctx = SharedContext()
+    ctx.set("a", "Full A output", summary="A summary")
+    ctx.set("b", "Full B")
+    assert ctx.index() == [
+        ("a", "A summary", len("Full A output")),
+        ("b", "Full B", len("Full B")),
+    ]
+
+
+def test_format_for_prompt_memoised_until_set():
+    ctx = SharedContext()
+    ctx.set("a", "full a", summary="sum a")
+    first = ctx.format_for_prompt(expand={"a"})
+    assert ctx.format_for_prompt(expand={"a"}) is first
+    assert ctx.format_for_prompt(expand=set()) == "## a (summary)\nsum a"
+
+    version = ctx.version
+    ctx.set("b", "full b")
+    assert ctx.version == version + 1
+    assert "## b\nfull b" in ctx.format_for_prompt()
+
+
+def test_format_for_prompt_memoised_per_expand_set():
+    ctx = SharedContext()
+    ctx.set("a", "full a", summary="sum a")
+    ctx.set("b", "full b", summary="sum b")
+    only_a = ctx.format_for_prompt(expand={"a"})
+    only_b = ctx.format_for_prompt(expand={"b"})
+    assert ctx.format_for_prompt(expand={"a"}) is only_a
+    assert ctx.format_for_prompt(expand={"b"}) is only_b
+    assert only_a == "## a\nfull a\n\n## b (summary)\nsum b"
+
+
+def test_format_for_prompt_expand_all_matches_default():
+    ctx = SharedContext()
+    ctx.set("a", "full a", summary="sum a")
+    ctx.set("b", "full b", summary="sum b")
+    default = ctx.format_for_prompt()
+    assert ctx.format_for_prompt(expand={"a", "b", "extra"}) is default
+
+
+def test_search_reuses_compiled_patterns():
+    ctx = SharedContext()
+    ctx.set("a", "alpha\nbeta")
+    ctx.search("be.a")
+    hits = _compile_search.cache_info().hits
+    assert ctx.search("be.a") == {"a": ["beta"]}
+    assert _compile_search.cache_info().hits == hits + 1
+
+
+def test_search_matches_lines_like_splitlines():
+    ctx = SharedContext()
+    ctx.set("a", "one apple\r\ntwo\nthree apples\napple\n")
+    assert ctx.search("apple") == {"a": ["one apple", "three apples", "apple"]}
+    assert ctx.search("^t") == {"a": ["two", "three apples"]}
+    assert ctx.search("two$") == {"a": ["two"]}
+    assert ctx.search("two\\s+three") == {}
+    assert ctx.search("") == {"a": ["one apple", "two", "three apples", "apple"]}
+
+
+def test_len_contains_and_iter():
+    ctx = SharedContext()
+    assert len(ctx) == 0
+    ctx.set("b", "2")
+    ctx.set("a", "1")
+    assert len(ctx) == 2
+    assert "a" in ctx
+    assert "c" not in ctx
+    assert list(ctx) == ["b", "a"]
+
+
+def test_search_splits_on_every_splitlines_boundary():
+    text = "red one\x0cblue\u2028red two\rgreen\r\nred three$"
+    ctx = SharedContext()
+    ctx.set("a", text)
+    expected = [line for line in text.splitlines() if "red" in line]
+    assert ctx.search("red") == {"a": expected}
+    assert ctx.search("^blue$") == {"a": ["blue"]}
+    assert ctx.search("green$") == {"a": ["green"]}
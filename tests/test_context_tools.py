@@ -1,3 +1,4 @@
+from swarmcore.agent import _function_to_tool_schema
 from swarmcore.context import SharedContext
 from swarmcore.context_tools import (
     make_context_tools,
@@ -102,3 +103,16 @@ def test_make_context_tools_returns_three():
     assert len(tools) == 3
     names = {t.__name__ for t in tools}
     assert names == {"list_context", "get_context", "search_context"}
+
+
+def test_context_tool_schemas_unchanged_and_shared():
+    first = make_context_tools(SharedContext())
+    second = make_context_tools(SharedContext())
+    for a, b in zip(first, second):
+        schema = _function_to_tool_schema(a)
+        assert schema is _function_to_tool_schema(b)
+        assert "self" not in schema["function"]["parameters"]["properties"]
+
+    get_schema = _function_to_tool_schema(first[1])["function"]
+    assert get_schema["name"] == "get_context"
+    assert get_schema["parameters"]["required"] == ["agent_name"]
@@ -125,6 +125,14 @@ def test_or_flow_agent(a: Agent, b: Agent, c: Agent):
     assert len(flow.steps[0]) == 3
 
 
+def test_or_extend_leaves_original_unchanged(a: Agent, b: Agent, c: Agent):
+    group = a >> (a | b)
+    extended = group | c
+    assert [ag.name for ag in group.steps[1]] == ["a", "b"]
+    assert [ag.name for ag in extended.steps[1]] == ["a", "b", "c"]
+    assert isinstance(extended.steps, list)
+
+
 # --- Mixed operators ---
 
 
@@ -153,6 +161,14 @@ def test_agents_deduplicates(a: Agent, b: Agent):
     assert [ag.name for ag in agents] == ["a", "b"]
 
 
+def test_agents_returns_fresh_list(a: Agent, b: Agent):
+    flow = chain(a, b)
+    first = flow.agents
+    first.clear()
+    assert [ag.name for ag in flow.agents] == ["a", "b"]
+    assert flow.agents is not flow.agents
+
+
 # --- repr ---
 
 
@@ -254,6 +270,12 @@ def test_nested_repr(a: Agent, b: Agent, c: Agent, d: Agent):
     assert "(c >> d)" in r
 
 
+def test_deeply_nested_repr(a: Agent, b: Agent, c: Agent, d: Agent):
+    inner = (a >> b) | (c >> d)
+    flow = (a >> inner >> d) | (b >> c)
+    assert repr(flow) == "Flow([(a >> [(a >> b), (c >> d)] >> d), (b >> c)])"
+
+
 def test_or_merges_parallel_groups(a: Agent, b: Agent, c: Agent):
     """a | (b | c) still produces a flat parallel group (no nesting)."""
     flow = a | (b | c)
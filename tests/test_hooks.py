@@ -1,5 +1,12 @@
 from __future__ import annotations
 
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from swarmcore.agent import Agent
+from swarmcore.context import SharedContext
 from swarmcore.hooks import Event, EventType, Hooks
 
 
@@ -132,3 +139,106 @@ async def test_multiple_handlers_same_event():
     await hooks.emit(Event(EventType.SWARM_START))
 
     assert results == [1, 2]
+
+
+async def test_is_subscribed_per_event_type():
+    hooks = Hooks()
+    assert not hooks.is_subscribed(EventType.AGENT_START)
+
+    hooks.on(EventType.AGENT_START, lambda e: None)
+    assert hooks.is_subscribed(EventType.AGENT_START)
+    assert not hooks.is_subscribed(EventType.TOOL_CALL_START)
+
+    hooks.on_all(lambda e: None)
+    assert all(hooks.is_subscribed(t) for t in EventType)
+
+
+async def test_global_handlers_run_before_specific_ones():
+    order: list[str] = []
+
+    hooks = Hooks()
+    hooks.on(EventType.AGENT_START, lambda e: order.append("specific"))
+    hooks.on_all(lambda e: order.append("global"))
+
+    await hooks.emit(Event(EventType.AGENT_START))
+    await hooks.emit(Event(EventType.AGENT_END))
+
+    assert order == ["global", "specific", "global"]
+
+
+async def test_emit_nowait_runs_sync_inline_and_defers_async():
+    order: list[str] = []
+
+    def sync_handler(event: Event) -> None:
+        order.append("sync")
+
+    async def async_handler(event: Event) -> None:
+        order.append("async")
+
+    async def failing_handler(event: Event) -> None:
+        raise RuntimeError("boom")
+
+    hooks = Hooks()
+    hooks.on(EventType.AGENT_START, async_handler)
+    hooks.on(EventType.AGENT_START, failing_handler)
+    hooks.on(EventType.AGENT_START, sync_handler)
+
+    hooks.emit_nowait(Event(EventType.AGENT_START, {"agent": "test"}))
+    assert order == ["sync"]
+
+    await hooks.drain()
+    assert order == ["sync", "async"]
+    assert not hooks._pending
+
+
+async def test_agent_run_drains_async_handlers(mock_llm: AsyncMock):
+    received: list[EventType] = []
+
+    async def handler(event: Event) -> None:
+        await asyncio.sleep(0)
+        received.append(event.type)
+
+    hooks = Hooks()
+    hooks.on_all(handler)
+
+    await Agent(name="a", instructions="Do A.").run(
+        "Task", SharedContext(), hooks=hooks
+    )
+
+    assert received[0] is EventType.AGENT_START
+    assert received[-1] is EventType.AGENT_END
+
+
+def test_event_type_is_str():
+    assert EventType.AGENT_END == "agent_end"
+    assert f"{EventType.LLM_TOKEN}" == "llm_token"
+    assert EventType("tool_call_end") is EventType.TOOL_CALL_END
+
+
+async def test_emit_awaits_async_callable_objects_and_sync_coroutine_returns():
+    hooks = Hooks()
+    seen: list[str] = []
+
+    class AsyncHandler:
+        async def __call__(self, event: Event) -> None:
+            seen.append("object")
+
+    async def later(event: Event) -> None:
+        seen.append("returned")
+
+    hooks.on_all(AsyncHandler())
+    hooks.on(EventType.STEP_END, lambda event: later(event))
+    hooks.on(EventType.STEP_END, lambda event: seen.append("sync"))
+
+    await hooks.emit(Event(EventType.STEP_END, {"step_index": 0}))
+
+    assert seen == ["object", "returned", "sync"]
+
+
+def test_event_default_data_is_shared_and_read_only():
+    first = Event(EventType.STEP_END)
+    second = Event(EventType.SWARM_START)
+    assert first.data is second.data
+    assert first.data.get("step_index") is None
+    with pytest.raises(TypeError):
+        first.data["x"] = 1  # type: ignore[index]
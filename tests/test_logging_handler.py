@@ -4,7 +4,7 @@ import logging
 
 import pytest
 
-from swarmcore.hooks import Event, EventType, Hooks
+from swarmcore.hooks import AgentEndData, AgentErrorData, Event, EventType, Hooks
 from swarmcore.logging import LoggingHandler, enable_logging
 
 
@@ -46,3 +46,89 @@ def test_enable_logging_returns_hooks():
 
     assert isinstance(hooks, Hooks)
     assert hooks.is_active is True
+
+
+def test_logging_handler_skips_disabled_levels(
+    caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch
+):
+    handler = LoggingHandler()
+    calls: list[object] = []
+    monkeypatch.setattr(
+        LoggingHandler, "_as_extra", staticmethod(lambda data: calls.append(data) or {})
+    )
+
+    with caplog.at_level(logging.INFO, logger="swarmcore"):
+        handler(Event(EventType.LLM_TOKEN, {"agent": "a", "text": "hi"}))
+        handler(Event(EventType.AGENT_START, {"agent": "a"}))
+
+    assert calls == [{"agent": "a"}]
+    assert [r.levelno for r in caplog.records] == [logging.INFO]
+
+
+def test_logging_handler_unlisted_event_logs_at_info(
+    caplog: pytest.LogCaptureFixture,
+):
+    handler = LoggingHandler()
+
+    with caplog.at_level(logging.DEBUG, logger="swarmcore"):
+        handler(Event(EventType.AGENT_RETRY, {"agent": "a", "attempt": 1}))
+
+    assert [r.levelno for r in caplog.records] == [logging.INFO]
+    assert caplog.records[0].agent == "a"
+
+
+def test_logging_handler_extra_from_typed_data(caplog: pytest.LogCaptureFixture):
+    handler = LoggingHandler()
+
+    with caplog.at_level(logging.INFO, logger="swarmcore"):
+        handler(
+            Event(EventType.AGENT_END, AgentEndData(agent="a", duration_seconds=1.0))
+        )
+
+    record = caplog.records[0]
+    assert (record.agent, record.duration_seconds, record.cost) == ("a", 1.0, 0.0)
+
+
+def test_logging_handler_message_omits_payload(caplog: pytest.LogCaptureFixture):
+    handler = LoggingHandler()
+
+    with caplog.at_level(logging.INFO, logger="swarmcore"):
+        handler(Event(EventType.AGENT_START, {"agent": "a", "task": "long task"}))
+
+    record = caplog.records[0]
+    assert record.getMessage() == "[agent_start] a"
+    assert record.task == "long task"
+
+
+def test_logging_handler_message_summarises_duration_and_error(
+    caplog: pytest.LogCaptureFixture,
+):
+    handler = LoggingHandler()
+
+    with caplog.at_level(logging.INFO, logger="swarmcore"):
+        handler(
+            Event(EventType.AGENT_END, AgentEndData(agent="a", duration_seconds=1.5))
+        )
+        handler(Event(EventType.AGENT_ERROR, AgentErrorData(agent="a", error="boom")))
+
+    assert [r.getMessage() for r in caplog.records] == [
+        "[agent_end] a 1.50s",
+        "[agent_error] a error: boom",
+    ]
+
+
+def test_logging_handler_summary_accepts_dict_payload(
+    caplog: pytest.LogCaptureFixture,
+):
+    handler = LoggingHandler()
+
+    with caplog.at_level(logging.INFO, logger="swarmcore"):
+        handler(Event(EventType.AGENT_END, {"agent": "a", "duration_seconds": None}))
+        handler(Event(EventType.SWARM_END, {"duration_seconds": "slow"}))
+        handler(Event(EventType.SWARM_END, {"duration_seconds": 2}))
+
+    assert [r.getMessage() for r in caplog.records] == [
+        "[agent_end] a None",
+        "[swarm_end] slow",
+        "[swarm_end] 2.00s",
+    ]
@@ -48,3 +48,15 @@ def test_summary_in_middle():
     assert "Preamble." in detail
     assert "Aftermath." in detail
     assert "<summary>" not in detail
+
+
+def test_unclosed_tag_degrades_gracefully():
+    output = "<summary>Never closed.\nBody text."
+    assert _parse_structured_output(output) == (output, output)
+
+
+def test_first_summary_block_wins():
+    output = "<summary>First.</summary>\nBody.\n<summary>Second.</summary>"
+    summary, detail = _parse_structured_output(output)
+    assert summary == "First."
+    assert detail == "Body.\n<summary>Second.</summary>"
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -278,6 +278,54 @@ async def test_retry_custom_multiplier(mock_sleep: AsyncMock, mock_llm: AsyncMoc
     assert delays == pytest.approx([0.1, 0.5])  # 0.1 * 5^0, 0.1 * 5^1
 
 
+@patch("asyncio.sleep", new_callable=AsyncMock)
+async def test_retry_max_delay_caps_backoff(mock_sleep: AsyncMock, mock_llm: AsyncMock):
+    """retry_max_delay bounds the exponential delay."""
+    mock_llm.side_effect = [
+        AgentError("a", "fail"),
+        AgentError("a", "fail"),
+        AgentError("a", "fail"),
+        make_mock_response(content="A output"),
+    ]
+
+    a = Agent(name="a", instructions="Do A.")
+    swarm = Swarm(
+        flow=chain(a),
+        step_retries=3,
+        retry_delay=1.0,
+        retry_multiplier=10.0,
+        retry_max_delay=5.0,
+    )
+    await swarm.run("Task")
+
+    delays = [call.args[0] for call in mock_sleep.call_args_list]
+    assert delays == [1.0, 5.0, 5.0]
+
+
+@patch("random.uniform", side_effect=lambda lo, hi: hi / 2)
+@patch("asyncio.sleep", new_callable=AsyncMock)
+async def test_retry_jitter(
+    mock_sleep: AsyncMock, mock_uniform: MagicMock, mock_llm: AsyncMock
+):
+    """retry_jitter draws each delay uniformly from [0, backoff]."""
+    mock_llm.side_effect = [
+        AgentError("a", "fail"),
+        AgentError("a", "fail"),
+        make_mock_response(content="A output"),
+    ]
+
+    a = Agent(name="a", instructions="Do A.")
+    swarm = Swarm(flow=chain(a), step_retries=2, retry_jitter=True)
+    await swarm.run("Task")
+
+    assert [call.args for call in mock_uniform.call_args_list] == [
+        (0.0, 1.0),
+        (0.0, 2.0),
+    ]
+    delays = [call.args[0] for call in mock_sleep.call_args_list]
+    assert delays == [0.5, 1.0]
+
+
 async def test_retry_zero_means_no_retry(mock_llm: AsyncMock):
     """step_retries=0 means exactly one attempt, no retries."""
     mock_llm.side_effect = AgentError("a", "fail")
@@ -289,3 +337,26 @@ async def test_retry_zero_means_no_retry(mock_llm: AsyncMock):
         await swarm.run("Task")
 
     assert mock_llm.call_count == 1
+
+
+@patch("asyncio.sleep", new_callable=AsyncMock)
+async def test_retry_honours_retry_after(mock_sleep: AsyncMock, mock_llm: AsyncMock):
+    """A Retry-After header on the provider error sets a floor on the delay."""
+
+    class RateLimited(Exception):
+        def __init__(self, retry_after: str) -> None:
+            super().__init__("rate limited")
+            self.response = MagicMock(headers={"retry-after": retry_after})
+
+    mock_llm.side_effect = [
+        RateLimited("5"),
+        RateLimited("not-a-number"),
+        make_mock_response(content="A output"),
+    ]
+
+    a = Agent(name="a", instructions="Do A.")
+    swarm = Swarm(flow=chain(a), step_retries=2)
+    await swarm.run("Task")
+
+    delays = [call.args[0] for call in mock_sleep.call_args_list]
+    assert delays == [5.0, 2.0]
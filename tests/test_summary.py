@@ -57,6 +57,52 @@ def _swarm_result(agents: list[AgentResult], *, duration: float = 10.0) -> Swarm
 # -- token_usage_table ------------------------------------------------
 
 
+def test_token_usage_iadd_sums_all_fields():
+    total = TokenUsage(prompt_tokens=1, completion_tokens=2, total_tokens=3)
+    alias = total
+    total += TokenUsage(
+        prompt_tokens=10,
+        completion_tokens=20,
+        total_tokens=30,
+        cache_read_tokens=4,
+        cache_creation_tokens=5,
+    )
+    assert alias is total
+    assert total == TokenUsage(
+        prompt_tokens=11,
+        completion_tokens=22,
+        total_tokens=33,
+        cache_read_tokens=4,
+        cache_creation_tokens=5,
+    )
+
+
+def test_token_usage_total():
+    usages = [
+        TokenUsage(prompt_tokens=1, completion_tokens=2, total_tokens=3),
+        TokenUsage(prompt_tokens=10, total_tokens=10, cache_read_tokens=4),
+    ]
+    assert TokenUsage.total(usages) == TokenUsage(
+        prompt_tokens=11, completion_tokens=2, total_tokens=13, cache_read_tokens=4
+    )
+    assert TokenUsage.total([]) == TokenUsage()
+
+
+def test_token_usage_from_usage():
+    class Details:
+        cached_tokens = 7
+
+    class Usage:
+        prompt_tokens = 10
+        completion_tokens = None
+        total_tokens = 10
+        prompt_tokens_details = Details()
+
+    usage = TokenUsage.from_usage(Usage())
+    assert usage == TokenUsage(prompt_tokens=10, total_tokens=10, cache_read_tokens=7)
+    assert TokenUsage.from_usage(None) == TokenUsage()
+
+
 def test_token_usage_table_basic():
     result = _swarm_result(
         [
@@ -259,6 +305,27 @@ def test_context_pull_report_first_agent_skipped():
     assert "a" not in report or report == ""
 
 
+def test_context_pull_report_ignores_non_string_arguments():
+    """Malformed ``agent_name`` arguments count as pulls but match no agent."""
+    malformed = ToolCallRecord(
+        tool_name="get_context",
+        arguments={"agent_name": ["a"]},
+        result="...",
+        duration_seconds=0.01,
+    )
+    result = _swarm_result(
+        [
+            _agent("a"),
+            _agent("b"),
+            _agent("c", tool_calls=[malformed, _get_context_call("b")], tools=2),
+        ]
+    )
+
+    report = result.context_pull_report()
+    assert "2/2" in report
+    assert "skipped: a" in report
+
+
 def test_context_pull_report_multiple_agents():
     """Multiple agents pulling context each get their own line."""
     result = _swarm_result(
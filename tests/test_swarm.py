@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import asyncio
+import json
+import time
 from unittest.mock import AsyncMock, MagicMock
 
+import pytest
 
-from swarmcore import Agent, Swarm, SwarmResult, chain, parallel
+from swarmcore import Agent, Swarm, SwarmResult, chain, current_agent, parallel
+from swarmcore.exceptions import AgentError
 from swarmcore.hooks import EventType, Hooks
 from swarmcore.models import AgentResult
 from tests.conftest import make_mock_response
@@ -109,6 +114,22 @@ async def test_result_structure(mock_llm: AsyncMock):
     assert all(isinstance(r, AgentResult) for r in result.history)
 
 
+async def test_result_round_trips_through_validation(mock_llm: AsyncMock):
+    mock_llm.side_effect = [
+        make_mock_response(content="A output", prompt_tokens=5, completion_tokens=10),
+        make_mock_response(content="B output", prompt_tokens=15, completion_tokens=25),
+    ]
+    swarm = Swarm(
+        flow=Agent(name="a", instructions="A.") >> Agent(name="b", instructions="B."),
+        context_mode="push",
+    )
+
+    result = await swarm.run("Task")
+
+    assert SwarmResult.model_validate(result.model_dump()) == result
+    assert result.history[0].llm_calls[0].token_usage.prompt_tokens == 5
+
+
 async def test_swarm_duration_and_total_usage(mock_llm: AsyncMock):
     mock_llm.side_effect = [
         make_mock_response(content="A output", prompt_tokens=5, completion_tokens=10),
@@ -157,6 +178,32 @@ async def test_swarm_with_hooks(mock_llm: AsyncMock):
     assert EventType.LLM_CALL_END in collected
 
 
+async def test_step_start_lists_agents_per_step(mock_llm: AsyncMock):
+    mock_llm.side_effect = [make_mock_response(content=f"Out {i}") for i in range(3)]
+    seen: list[tuple[int, list[str], bool]] = []
+
+    def record(e) -> None:
+        seen.append((e.data.step_index, e.data.agents, e.data.parallel))
+        e.data.agents.append("mutated")  # must not leak into the next run
+
+    hooks = Hooks()
+    hooks.on(EventType.STEP_START, record)
+
+    a = Agent(name="a", instructions="Do A.")
+    b = Agent(name="b", instructions="Do B.")
+    c = Agent(name="c", instructions="Do C.")
+    swarm = Swarm(flow=a >> (b | c), hooks=hooks, context_mode="push")
+    await swarm.run("Task")
+    seen.clear()
+    mock_llm.side_effect = [make_mock_response(content=f"Out {i}") for i in range(3)]
+    await swarm.run("Task")
+
+    assert seen == [
+        (0, ["a", "mutated"], False),
+        (1, ["b", "c", "mutated"], True),
+    ]
+
+
 # --- Tiered context tests (push mode) ---
 
 
@@ -308,6 +355,12 @@ async def test_expand_hint_in_system_prompt(mock_llm: AsyncMock):
     c_call = mock_llm.call_args_list[2]
     c_system = c_call.kwargs["messages"][0]["content"]
     assert "expand_context" in c_system
+    (expand_schema,) = [
+        t["function"]
+        for t in c_call.kwargs["tools"]
+        if t["function"]["name"] == "expand_context"
+    ]
+    assert list(expand_schema["parameters"]["properties"]) == ["agent_name"]
 
     # B has no summarized entries (only A at full), so no hint
     b_call = mock_llm.call_args_list[1]
@@ -533,6 +586,56 @@ async def test_pull_mode_parallel_step(mock_llm: AsyncMock):
         assert "A output." in system
 
 
+async def test_parallel_search_context_while_sibling_writes(
+    mock_llm: AsyncMock, monkeypatch: pytest.MonkeyPatch
+):
+    """search_context runs on the loop, so a sibling's context write cannot
+    change the dict while the search iterates it."""
+    import swarmcore.context as context_module
+
+    real_matching_lines = context_module._matching_lines
+
+    def slow_matching_lines(regex, value):
+        time.sleep(0.02)  # long enough for C to finish if the loop were free
+        return real_matching_lines(regex, value)
+
+    monkeypatch.setattr(context_module, "_matching_lines", slow_matching_lines)
+
+    search_call = MagicMock()
+    search_call.id = "call_search"
+    search_call.function.name = "search_context"
+    search_call.function.arguments = '{"query": "output"}'
+
+    async def respond(**kwargs):
+        messages = kwargs["messages"]
+        system = str(messages[0]["content"])
+        if "Do A." in system:
+            return make_mock_response(content="A output.")
+        if "Do M." in system:
+            return make_mock_response(content="M output.")
+        if "Do C." in system:
+            await asyncio.sleep(0.01)
+            return make_mock_response(content="C output.")
+        if messages[-1]["role"] == "tool":
+            return make_mock_response(content="B output.")
+        return make_mock_response(content=None, tool_calls=[search_call])
+
+    mock_llm.side_effect = respond
+
+    a = Agent(name="a", instructions="Do A.")
+    m = Agent(name="m", instructions="Do M.")
+    b = Agent(name="b", instructions="Do B.")
+    c = Agent(name="c", instructions="Do C.")
+
+    # A is an earlier entry for the parallel step, so pull tools are injected
+    swarm = Swarm(flow=chain(a, m, parallel(b, c)), context_mode="pull")
+    result = await swarm.run("Task")
+
+    b_result = next(r for r in result.history if r.agent_name == "b")
+    assert "A output." in b_result.tool_calls[0].result
+    assert result.context["c"] == "C output."
+
+
 # --- Nested sub-flow execution tests ---
 
 
@@ -990,3 +1093,236 @@ async def test_push_mode_context_budget_not_exceeded_expands(mock_llm: AsyncMock
     b_call = mock_llm.call_args_list[1]
     b_system = b_call.kwargs["messages"][0]["content"]
     assert "A detail." in b_system
+
+
+async def test_pull_mode_context_budget_keeps_outputs_that_fit(mock_llm: AsyncMock):
+    """Pull mode: prev-step outputs that fit the budget stay pushed; the rest are demoted."""
+    mock_llm.side_effect = [
+        make_mock_response(content="<summary>A sum.</summary>\nA detail."),
+        make_mock_response(content="<summary>B sum.</summary>\n" + "B" * 5000),
+        make_mock_response(content="C output."),
+    ]
+
+    a = Agent(name="a", instructions="Do A.")
+    b = Agent(name="b", instructions="Do B.")
+    c = Agent(name="c", instructions="Do C.")
+
+    swarm = Swarm(
+        flow=chain(parallel(a, b), c),
+        context_mode="pull",
+        context_budget=100,
+    )
+    await swarm.run("Task")
+
+    c_call = mock_llm.call_args_list[2]
+    c_system = c_call.kwargs["messages"][0]["content"]
+    assert "A detail." in c_system
+    assert "BBBBB" not in c_system
+    assert "B sum." in c_system
+
+    tool_names = {t["function"]["name"] for t in c_call.kwargs.get("tools", [])}
+    assert "get_context" in tool_names
+
+
+async def test_push_mode_context_budget_keeps_outputs_that_fit(mock_llm: AsyncMock):
+    """Push mode: expanded outputs that fit the budget stay in full; the rest are summarized."""
+    mock_llm.side_effect = [
+        make_mock_response(content="<summary>A sum.</summary>\n" + "A" * 5000),
+        make_mock_response(content="<summary>B sum.</summary>\nB detail."),
+        make_mock_response(content="C output."),
+    ]
+
+    a = Agent(name="a", instructions="Do A.")
+    b = Agent(name="b", instructions="Do B.")
+    c = Agent(name="c", instructions="Do C.")
+
+    swarm = Swarm(
+        flow=chain(parallel(a, b), c),
+        context_mode="push",
+        context_budget=100,
+    )
+    await swarm.run("Task")
+
+    c_call = mock_llm.call_args_list[2]
+    c_system = c_call.kwargs["messages"][0]["content"]
+    assert "AAAAA" not in c_system
+    assert "B detail." in c_system
+
+    tool_names = {t["function"]["name"] for t in c_call.kwargs.get("tools", [])}
+    assert "expand_context" in tool_names
+
+
+# --- Parallel step concurrency ---
+
+
+async def test_parallel_branches_overlap(mock_llm: AsyncMock):
+    """All branches of a parallel step are in flight at the same time."""
+    in_flight = 0
+    peak = 0
+
+    async def slow_call(**kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return make_mock_response(content="output")
+
+    mock_llm.side_effect = slow_call
+
+    a = Agent(name="a", instructions="Do A.")
+    b = Agent(name="b", instructions="Do B.")
+    c = Agent(name="c", instructions="Do C.")
+
+    swarm = Swarm(flow=a | b | c)
+    result = await swarm.run("Task")
+
+    assert len(result.history) == 3
+    assert peak == 3
+
+
+async def test_max_concurrency_limits_parallel_branches(mock_llm: AsyncMock):
+    """max_concurrency caps how many agents run at once."""
+    in_flight = 0
+    peak = 0
+
+    async def slow_call(**kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return make_mock_response(content="output")
+
+    mock_llm.side_effect = slow_call
+
+    agents = [Agent(name=n, instructions=f"Do {n}.") for n in "abcd"]
+    swarm = Swarm(flow=chain(parallel(*agents)), max_concurrency=2)
+    result = await swarm.run("Task")
+
+    assert len(result.history) == 4
+    assert peak == 2
+
+
+async def test_max_concurrency_is_per_run(mock_llm: AsyncMock):
+    """Concurrent runs on one Swarm each get their own max_concurrency limit."""
+    in_flight = {"Task A": 0, "Task B": 0}
+    peak = dict(in_flight)
+    both_started = asyncio.Event()
+
+    async def slow_call(**kwargs):
+        run = next(t for t in in_flight if t in kwargs["messages"][-1]["content"])
+        in_flight[run] += 1
+        peak[run] = max(peak[run], in_flight[run])
+        if all(in_flight.values()):
+            both_started.set()
+        await asyncio.wait_for(both_started.wait(), timeout=1)
+        in_flight[run] -= 1
+        return make_mock_response(content="output")
+
+    mock_llm.side_effect = slow_call
+
+    agents = [Agent(name=n, instructions=f"Do {n}.") for n in "ab"]
+    swarm = Swarm(flow=chain(parallel(*agents)), max_concurrency=1)
+    first, second = await asyncio.gather(swarm.run("Task A"), swarm.run("Task B"))
+
+    assert len(first.history) == len(second.history) == 2
+    assert peak == {"Task A": 1, "Task B": 1}
+
+
+def test_max_concurrency_must_be_positive():
+    with pytest.raises(ValueError, match="max_concurrency"):
+        Swarm(flow=chain(Agent(name="a", instructions="A.")), max_concurrency=0)
+
+
+async def test_parallel_failure_waits_for_siblings(mock_llm: AsyncMock):
+    """A failing branch is raised only after its siblings have settled."""
+    finished: list[str] = []
+
+    async def route(**kwargs):
+        system = kwargs["messages"][0]["content"]
+        if "Do A." in system:
+            raise RuntimeError("boom")
+        await asyncio.sleep(0.01)
+        finished.append("b")
+        return make_mock_response(content="B output")
+
+    mock_llm.side_effect = route
+
+    a = Agent(name="a", instructions="Do A.")
+    b = Agent(name="b", instructions="Do B.")
+
+    swarm = Swarm(flow=a | b)
+    with pytest.raises(AgentError, match="boom"):
+        await swarm.run("Task")
+
+    assert finished == ["b"]
+
+
+async def test_current_agent_isolated_across_parallel_branches(mock_llm: AsyncMock):
+    """Each parallel branch sees its own agent in ``current_agent``."""
+    seen: dict[str, str | None] = {}
+
+    async def route(**kwargs):
+        system = kwargs["messages"][0]["content"]
+        label = "a" if "Do A." in system else "b"
+        await asyncio.sleep(0.01)
+        seen[label] = current_agent.get()
+        return make_mock_response(content=f"{label} output")
+
+    mock_llm.side_effect = route
+
+    a = Agent(name="a", instructions="Do A.")
+    b = Agent(name="b", instructions="Do B.")
+
+    await Swarm(flow=a | b).run("Task")
+
+    assert seen == {"a": "a", "b": "b"}
+
+
+async def test_history_file_appends_results_as_agents_finish(
+    mock_llm: AsyncMock, tmp_path
+):
+    """Each AgentResult is written as a JSON line when its agent completes."""
+    mock_llm.side_effect = [
+        make_mock_response(content="<summary>A sum.</summary>\nA detail."),
+        make_mock_response(content="B output."),
+    ]
+    path = tmp_path / "runs" / "history.jsonl"
+
+    swarm = Swarm(
+        flow=Agent(name="a", instructions="Do A.")
+        >> Agent(name="b", instructions="Do B."),
+        history_file=str(path),
+    )
+    result = await swarm.run("Task")
+
+    lines = path.read_text().splitlines()
+    assert [AgentResult.model_validate_json(line) for line in lines] == result.history
+
+
+async def test_history_file_tags_lines_with_run_id(mock_llm: AsyncMock, tmp_path):
+    """Concurrent runs sharing a file can be told apart; the directory is
+    created on the first append, not at construction."""
+    mock_llm.side_effect = [make_mock_response(content="out")] * 4
+    path = tmp_path / "runs" / "history.jsonl"
+
+    swarm = Swarm(
+        flow=chain(
+            parallel(
+                Agent(name="a", instructions="Do A."),
+                Agent(name="b", instructions="Do B."),
+            )
+        ),
+        history_file=str(path),
+    )
+    assert not path.parent.exists()
+
+    await asyncio.gather(swarm.run("One"), swarm.run("Two"))
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    by_run: dict[str, list[str]] = {}
+    for record in records:
+        by_run.setdefault(record["run_id"], []).append(record["agent_name"])
+    assert len(by_run) == 2
+    assert all(sorted(names) == ["a", "b"] for names in by_run.values())
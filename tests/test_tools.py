@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+import sqlite3
+import threading
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from swarmcore.agent import _function_to_tool_schema
-from swarmcore.tools import search_web
+from swarmcore.tools import cached_tool, search_web
 
 
 # --- search_web returns formatted results ---
 
 
-def test_search_web_returns_formatted_results():
+async def test_search_web_returns_formatted_results():
     fake_results = [
         {
             "title": "First Result",
@@ -33,7 +37,7 @@ def test_search_web_returns_formatted_results():
         import swarmcore.tools
 
         reload(swarmcore.tools)
-        result = swarmcore.tools.search_web("test query")
+        result = await swarmcore.tools.search_web("test query")
 
     assert "**First Result**" in result
     assert "Description of first result." in result
@@ -48,7 +52,7 @@ def test_search_web_returns_formatted_results():
 # --- max_results is forwarded ---
 
 
-def test_search_web_forwards_max_results():
+async def test_search_web_forwards_max_results():
     mock_ddgs_instance = MagicMock()
     mock_ddgs_instance.text.return_value = []
 
@@ -60,7 +64,7 @@ def test_search_web_forwards_max_results():
         import swarmcore.tools
 
         reload(swarmcore.tools)
-        swarmcore.tools.search_web("test query", max_results=10)
+        await swarmcore.tools.search_web("test query", max_results=10)
 
     mock_ddgs_instance.text.assert_called_once_with("test query", max_results=10)
 
@@ -68,7 +72,7 @@ def test_search_web_forwards_max_results():
 # --- graceful degradation when ddgs is not installed ---
 
 
-def test_search_web_import_error():
+async def test_search_web_import_error():
     original_import = (
         __builtins__.__import__ if hasattr(__builtins__, "__import__") else __import__
     )
@@ -84,7 +88,7 @@ def test_search_web_import_error():
         import swarmcore.tools
 
         reload(swarmcore.tools)
-        result = swarmcore.tools.search_web("test query")
+        result = await swarmcore.tools.search_web("test query")
 
     assert "ddgs is not installed" in result
     assert "pip install ddgs" in result
@@ -93,7 +97,7 @@ def test_search_web_import_error():
 # --- empty results ---
 
 
-def test_search_web_empty_results():
+async def test_search_web_empty_results():
     mock_ddgs_instance = MagicMock()
     mock_ddgs_instance.text.return_value = []
 
@@ -105,11 +109,40 @@ def test_search_web_empty_results():
         import swarmcore.tools
 
         reload(swarmcore.tools)
-        result = swarmcore.tools.search_web("nonexistent query")
+        result = await swarmcore.tools.search_web("nonexistent query")
 
     assert result == "No results found."
 
 
+# --- does not block the event loop ---
+
+
+async def test_search_web_runs_off_event_loop():
+    import threading
+
+    caller_thread = threading.get_ident()
+    search_threads: list[int] = []
+
+    def fake_text(query, max_results):
+        search_threads.append(threading.get_ident())
+        return []
+
+    mock_ddgs_instance = MagicMock()
+    mock_ddgs_instance.text.side_effect = fake_text
+
+    mock_ddgs_cls = MagicMock(return_value=mock_ddgs_instance)
+
+    with patch.dict("sys.modules", {"ddgs": MagicMock(DDGS=mock_ddgs_cls)}):
+        from importlib import reload
+
+        import swarmcore.tools
+
+        reload(swarmcore.tools)
+        await swarmcore.tools.search_web("test query")
+
+    assert search_threads and search_threads[0] != caller_thread
+
+
 # --- tool schema compatibility ---
 
 
@@ -134,3 +167,167 @@ def test_search_web_tool_schema():
     # query is required, max_results has a default so it's not required
     assert "query" in params["required"]
     assert "max_results" not in params["required"]
+
+
+# --- cached_tool ---
+
+
+def test_cached_tool_reuses_result():
+    calls: list[str] = []
+
+    @cached_tool()
+    def lookup(term: str) -> str:
+        """Look up a term."""
+        calls.append(term)
+        return f"result for {term}"
+
+    assert lookup("a") == "result for a"
+    assert lookup(term="a") == "result for a"
+    assert lookup("b") == "result for b"
+    assert calls == ["a", "b"]
+
+
+async def test_cached_tool_async():
+    calls: list[str] = []
+
+    @cached_tool()
+    async def lookup(term: str) -> str:
+        """Look up a term."""
+        calls.append(term)
+        return f"result for {term}"
+
+    assert await lookup("a") == "result for a"
+    assert await lookup("a") == "result for a"
+    assert calls == ["a"]
+
+
+def test_cached_tool_skips_errors():
+    calls: list[str] = []
+
+    @cached_tool()
+    def lookup(term: str) -> str:
+        """Look up a term."""
+        calls.append(term)
+        return "Error: unavailable"
+
+    lookup("a")
+    lookup("a")
+    assert calls == ["a", "a"]
+
+
+def test_cached_tool_ttl_expiry():
+    calls: list[str] = []
+
+    @cached_tool(ttl=0)
+    def lookup(term: str) -> str:
+        """Look up a term."""
+        calls.append(term)
+        return "ok"
+
+    lookup("a")
+    lookup("a")
+    assert calls == ["a", "a"]
+
+
+def test_cached_tool_lru_eviction():
+    calls: list[str] = []
+
+    @cached_tool(maxsize=1)
+    def lookup(term: str) -> str:
+        """Look up a term."""
+        calls.append(term)
+        return "ok"
+
+    lookup("a")
+    lookup("b")
+    lookup("a")
+    assert calls == ["a", "b", "a"]
+
+
+def test_cached_tool_persists_to_store(tmp_path):
+    store = str(tmp_path / "cache" / "tools.sqlite")
+    calls: list[str] = []
+
+    def lookup(term: str) -> str:
+        """Look up a term."""
+        calls.append(term)
+        return f"result for {term}"
+
+    first = cached_tool(store=store)(lookup)
+    second = cached_tool(store=store)(lookup)
+
+    assert first("a") == "result for a"
+    assert second("a") == "result for a"
+    assert calls == ["a"]
+
+
+async def test_cached_tool_async_store_off_loop_and_closed(tmp_path, monkeypatch):
+    store = str(tmp_path / "tools.sqlite")
+    opened: list[tuple[int, sqlite3.Connection]] = []
+    connect = sqlite3.connect
+
+    def tracking_connect(*args, **kwargs):
+        conn = connect(*args, **kwargs)
+        opened.append((threading.get_ident(), conn))
+        return conn
+
+    async def lookup(term: str) -> str:
+        """Look up a term."""
+        return f"result for {term}"
+
+    first = cached_tool(store=store)(lookup)
+    monkeypatch.setattr(sqlite3, "connect", tracking_connect)
+    second = cached_tool(store=store)(lookup)
+    opened.clear()
+
+    assert await first("a") == "result for a"
+    assert await second("a") == "result for a"
+
+    loop_thread = threading.get_ident()
+    assert len(opened) == 3  # miss + write for first, hit for second
+    assert all(ident != loop_thread for ident, _ in opened)
+    for _, conn in opened:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+
+def test_cached_tool_preserves_schema():
+    @cached_tool()
+    def lookup(term: str, limit: int = 3) -> str:
+        """Look up a term.
+
+        term: The term to look up
+        """
+        return "ok"
+
+    schema = _function_to_tool_schema(lookup)
+    assert schema["function"]["name"] == "lookup"
+    assert schema["function"]["parameters"]["required"] == ["term"]
+    assert schema["function"]["parameters"]["properties"]["limit"]["type"] == "integer"
+
+
+async def test_search_web_store_shares_normalized_query(tmp_path):
+    mock_ddgs_instance = MagicMock()
+    mock_ddgs_instance.text.return_value = [
+        {"title": "T", "body": "B", "href": "https://example.com"}
+    ]
+
+    mock_ddgs_cls = MagicMock(return_value=mock_ddgs_instance)
+
+    with patch.dict("sys.modules", {"ddgs": MagicMock(DDGS=mock_ddgs_cls)}):
+        from importlib import reload
+
+        import swarmcore.tools
+
+        reload(swarmcore.tools)
+        # The wrapping shown in the README: the persistent tier keys on the
+        # normalised query, so a fresh wrapper still hits it
+        wrap = cached_tool(
+            store=str(tmp_path / "search.sqlite"),
+            key=lambda args: f"{args['query'].strip().lower()}\0{args['max_results']}",
+        )
+        first = await wrap(swarmcore.tools.search_web)("Test Query")
+        second = await wrap(swarmcore.tools.search_web)("  test query ")
+
+    assert first == second
+    mock_ddgs_instance.text.assert_called_once()
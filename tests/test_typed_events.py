@@ -64,6 +64,26 @@ def test_bracket_raises_key_error_for_missing() -> None:
         data["nonexistent"]
 
 
+def test_bracket_rejects_method_names() -> None:
+    data = AgentStartData(agent="a", task="t")
+    with pytest.raises(KeyError):
+        data["items"]
+
+
+# ---------------------------------------------------------------------------
+# Key iteration and membership
+# ---------------------------------------------------------------------------
+
+
+def test_iter_and_contains_use_field_names() -> None:
+    data = AgentEndData(agent="a", duration_seconds=1.0)
+    assert list(data) == ["agent", "duration_seconds", "cost"]
+    assert "cost" in data
+    assert "get" not in data
+    assert AgentEndData._field_names() is AgentEndData._field_names()
+    assert AgentStartData._field_names() == ("agent", "task")
+
+
 # ---------------------------------------------------------------------------
 # .items()
 # ---------------------------------------------------------------------------
@@ -75,6 +95,12 @@ def test_items_returns_all_fields() -> None:
     assert items == {"agent": "a", "task": "t"}
 
 
+def test_items_are_shallow() -> None:
+    arguments = {"q": ["x"]}
+    data = ToolCallStartData(agent="a", tool="search", arguments=arguments)
+    assert dict(data.items())["arguments"] is arguments
+
+
 # ---------------------------------------------------------------------------
 # All 11 data classes can be constructed and accessed
 # ---------------------------------------------------------------------------
@@ -208,3 +234,9 @@ def test_event_with_dict_data() -> None:
 def test_event_default_data_is_empty_dict() -> None:
     event = Event(type=EventType.SWARM_START)
     assert event.data == {}
+
+
+def test_event_data_has_no_instance_dict() -> None:
+    data = LLMCallStartData(agent="a", call_index=0)
+    assert not hasattr(data, "__dict__")
+    assert not hasattr(Event(EventType.LLM_CALL_START, data), "__dict__")